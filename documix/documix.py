@@ -16,7 +16,7 @@ import email
 import email.policy
 from email.parser import BytesParser
 from pathlib import Path
-from collections import Counter
+from collections import Counter, deque
 import string
 import textwrap
 import base64
@@ -24,6 +24,15 @@ import quopri
 import json
 import difflib
 import platform
+import hashlib
+import mmap
+import atexit
+import functools
+import contextlib
+import queue
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import html2text
 
 # Try to import docx2txt for fallback DOCX processing
@@ -49,9 +58,91 @@ CONVERTER_DEFAULTS = {
     'rtf': ['pandoc', 'unrtf', 'striprtf'],
 }
 
+# Default location of the conversion cache (used by --cache without a path)
+CACHE_DEFAULT_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'documix')
+
+# Code block language for each file extension
+FILE_LANGUAGES = {
+    '.py': 'python',
+    '.rb': 'ruby',
+    '.js': 'javascript',
+    '.html': 'html',
+    '.css': 'css',
+    '.json': 'json',
+    '.yml': 'yaml',
+    '.yaml': 'yaml',
+    '.md': 'markdown',
+    '.txt': 'text',
+    '.sh': 'bash',
+    '.java': 'java',
+    '.c': 'c',
+    '.cpp': 'cpp',
+    '.h': 'c',
+    '.php': 'php',
+    '.sql': 'sql',
+    '.xml': 'xml',
+    '.go': 'go',
+    '.rs': 'rust',
+    '.ts': 'typescript',
+    '.swift': 'swift',
+    '.kt': 'kotlin',
+    '.dart': 'dart',
+    '.pl': 'perl',
+    '.r': 'r',
+    '.lua': 'lua',
+    '.scala': 'scala',
+    '.cs': 'csharp',
+    '.vb': 'vb'
+}
+
+# ZIP members larger than this (uncompressed) are listed but not extracted
+MAX_ZIP_MEMBER_SIZE = 100 * 1024 * 1024
+
+# Text files at least this large are read through mmap instead of read()
+MMAP_MIN_SIZE = 64 * 1024
+
+# DocumentCompiler method that processes each extension; everything else is
+# read as plain text. Stored by name so patched methods are picked up.
+FILE_HANDLERS = {
+    '.pdf': 'convert_pdf_to_text',
+    '.epub': 'convert_epub_to_text',
+    '.docx': 'convert_docx_to_text',
+    '.doc': 'convert_doc_to_text',
+    '.rtf': 'convert_rtf_to_text',
+    '.zip': 'extract_zip',
+    '.eml': 'convert_eml_to_text',
+}
+
+# Threads used to read plain-text files ahead while conversions run, per
+# job, and the most used regardless of --jobs
+TEXT_READERS_PER_JOB = 4
+TEXT_READ_WORKERS = 32
+
+# Write buffer for the compiled output file
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# Files kept in flight per worker thread during parallel processing; bounds
+# how far conversions and reads run ahead of the output being written
+PROCESS_WINDOW_PER_WORKER = 2
 
+# Upper bound on simultaneous LibreOffice conversions when processing in parallel
+SOFFICE_MAX_CONCURRENCY = 4
+
+# Upper bound on simultaneous ML PDF conversions (mineru, PaddleOCR); each
+# loads a multi-GB model on the CPU, so parallel jobs take turns
+ML_CONVERTER_MAX_CONCURRENCY = 1
+
+# Number of DOC files converted per LibreOffice invocation during compile()
+SOFFICE_BATCH_SIZE = 10
+
+
+@functools.lru_cache(maxsize=None)
 def get_version():
-    """Return version string. Appends git branch when running from a repo checkout."""
+    """Return version string. Appends git branch when running from a repo checkout.
+
+    Cached: every DocumentCompiler asks for it, and the git lookup costs a
+    subprocess.
+    """
     from documix import __version__
     try:
         result = subprocess.run(
@@ -68,6 +159,183 @@ def get_version():
     return __version__
 
 
+def _file_fingerprint(filepath, sample_size=65536):
+    """Return a fast fingerprint of a file for cache lookups.
+
+    Hashes the size, mtime and the first/last *sample_size* bytes instead of
+    the whole file, so large documents are keyed with a couple of small reads.
+    """
+    stat = os.stat(filepath)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    with open(filepath, 'rb') as f:
+        digest.update(f.read(sample_size))
+        if stat.st_size > sample_size:
+            f.seek(max(sample_size, stat.st_size - sample_size))
+            digest.update(f.read(sample_size))
+    return digest.hexdigest()
+
+
+# Leading bytes of files LibreOffice can open when they carry a .doc extension:
+# OLE2 compound documents (Word 97-2003), ZIP (DOCX saved as .doc), RTF and
+# Word for DOS/Word 2 files
+DOC_SIGNATURES = (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', b'PK\x03\x04', b'{\\rtf',
+                  b'\x31\xbe\x00\x00', b'\xdb\xa5', b'\x9b\xa5')
+
+
+def _doc_input_problem(filepath):
+    """Return why *filepath* cannot be a DOC file, or None if it might be one.
+
+    Reading the first bytes is far cheaper than starting LibreOffice just to
+    have it reject an empty or unrelated file.
+    """
+    with open(filepath, 'rb') as f:
+        head = f.read(16)
+    if not head:
+        return f"File {filepath} is empty (0 bytes)"
+    # HTML and Word 2003 XML documents are also commonly saved as .doc
+    if head.startswith(DOC_SIGNATURES) or head.lstrip(b'\xef\xbb\xbf \t\r\n').startswith(b'<'):
+        return None
+    return f"File {filepath} does not look like a Word document"
+
+
+def _looks_binary(filepath, sample_size=8192):
+    """Return True if the start of *filepath* contains a NUL byte.
+
+    Text files essentially never contain NUL, while nearly every binary
+    format does within its first few KB; bytes.find runs in C (memchr).
+    """
+    with open(filepath, 'rb') as f:
+        return f.read(sample_size).find(b'\x00') != -1
+
+
+@functools.lru_cache(maxsize=None)
+def _tool_path(name):
+    """Return the absolute path of external tool *name*, looked up once.
+
+    Falls back to the bare name so a missing tool still raises
+    FileNotFoundError from subprocess, exactly as before.
+    """
+    return shutil.which(name) or name
+
+
+def _have_tool(name):
+    """Return True if external tool *name* is on PATH (cached by _tool_path)."""
+    return _tool_path(name) != name
+
+
+def _run_tool(cmd, **kwargs):
+    """subprocess.run for external converters, skipping per-spawn overhead.
+
+    The binary is resolved once instead of on every PATH walk, and
+    close_fds=False spares the child from closing every descriptor up to
+    RLIMIT_NOFILE. Nothing leaks: Python opens its descriptors
+    non-inheritable (PEP 446).
+    """
+    return subprocess.run([_tool_path(cmd[0]), *cmd[1:]], close_fds=False, **kwargs)
+
+
+class _SofficeDaemon:
+    """A headless LibreOffice instance shared by all DOC conversions.
+
+    Starting soffice dominates the cost of converting a DOC file, so when
+    unoconv is installed the conversions are sent over a UNO socket to one
+    long-lived soffice process instead of spawning a new one per file. The
+    instance uses its own profile directory so it does not collide with a
+    desktop LibreOffice session, and is shut down at interpreter exit.
+
+    One instance does not load documents reliably in parallel, so callers
+    hold convert_lock while converting through it. A failed start is
+    remembered, so later conversions go straight to one-shot soffice
+    instead of waiting START_TIMEOUT again.
+    """
+
+    START_TIMEOUT = 30
+
+    def __init__(self):
+        self.process = None
+        self.port = None
+        self.profile_dir = None
+        self.failed = False
+        self.convert_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._atexit_registered = False
+
+    def connection(self):
+        """Returns the UNO connection string, starting soffice if needed.
+
+        Returns None if the instance could not be started.
+        """
+        with self._lock:
+            if self.failed:
+                return None
+            if self.process is None or self.process.poll() is not None:
+                self._start()
+            if self.process is None:
+                return None
+            return f"socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext"
+
+    def _start(self):
+        self._cleanup()
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        profile_dir = tempfile.mkdtemp(prefix='documix-uno-')
+        try:
+            process = subprocess.Popen(
+                [_tool_path('soffice'), '--headless', '--invisible', '--nologo', '--norestore',
+                 f'-env:UserInstallation={Path(profile_dir).as_uri()}',
+                 f'--accept=socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError as e:
+            print(f"WARNING: Could not start LibreOffice listener: {e}")
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            self.failed = True
+            return
+        self.process, self.port, self.profile_dir = process, port, profile_dir
+        if not self._atexit_registered:
+            atexit.register(self.stop)
+            self._atexit_registered = True
+
+        deadline = time.time() + self.START_TIMEOUT
+        while time.time() < deadline and process.poll() is None:
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                return
+            except OSError:
+                time.sleep(0.2)
+        print("WARNING: LibreOffice listener did not start, using one-shot soffice")
+        self._cleanup()
+        self.failed = True
+
+    def _cleanup(self):
+        if self.process is not None and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        if self.profile_dir:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+        self.process = self.port = self.profile_dir = None
+
+    def stop(self):
+        """Terminates the soffice instance and removes its profile."""
+        with self._lock:
+            self._cleanup()
+
+    def disable(self):
+        """Stops the instance and stops handing out connections for good."""
+        with self._lock:
+            self._cleanup()
+            self.failed = True
+
+
+_SOFFICE_DAEMON = _SofficeDaemon()
+
+
 class EmailProcessor:
     """Processes email files (.eml) and their attachments."""
     
@@ -293,7 +561,7 @@ class EmailProcessor:
             return "\n".join(output), []
 
 class DocumentCompiler:
-    def __init__(self, source_path, output_file, recursive=False, include_extensions=None, exclude_patterns=None, force_format=None, converter_config=None):
+    def __init__(self, source_path, output_file, recursive=False, include_extensions=None, exclude_patterns=None, force_format=None, converter_config=None, cache_dir=None, jobs=None):
         self.source_path = os.path.abspath(source_path)
         self.is_single_file = os.path.isfile(self.source_path)
         self.source_dir = os.path.dirname(self.source_path) if self.is_single_file else self.source_path
@@ -302,6 +570,21 @@ class DocumentCompiler:
         self.version = get_version()
         self.force_format = force_format  # Can be 'standard' or None (auto-detect)
         self.converter_config = converter_config or {}
+        # Directory for cached conversion results (None disables caching)
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        # Number of files converted concurrently (None uses all CPUs)
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self._read_workers = min(TEXT_READ_WORKERS, TEXT_READERS_PER_JOB * self.jobs)
+        # LibreOffice slots, handed out LIFO so the most recently used (warm)
+        # profile is picked first. With more than one slot each keeps a private
+        # profile dir, created on first use, as concurrent soffice processes
+        # must not share one
+        slots = min(self.jobs, SOFFICE_MAX_CONCURRENCY)
+        self._soffice_slots = queue.LifoQueue()
+        for slot in reversed(range(slots)):
+            self._soffice_slots.put(slot)
+        self._soffice_profiles = [None] * slots
+        self._ml_slots = threading.BoundedSemaphore(ML_CONVERTER_MAX_CONCURRENCY)
 
         # Statistics data
         self.total_files = 0
@@ -314,6 +597,7 @@ class DocumentCompiler:
         self._mineru_available = None
         self._paddleocr_available = None
         self._paddleocr_python = None
+        self._unoconv_available = None
         
         
         # Temporary directory for ZIP extraction
@@ -328,8 +612,9 @@ class DocumentCompiler:
         
         # Convert extensions to lowercase for consistency
         self.include_extensions = [ext.lower() for ext in self.include_extensions]
+        self._include_ext_set = frozenset(self.include_extensions)
         
-        # Compile exclusion patterns
+        # Compile exclusion patterns (already compiled ones are reused as-is)
         self.exclude_patterns = []
         if exclude_patterns:
             for pattern in exclude_patterns:
@@ -342,11 +627,54 @@ class DocumentCompiler:
         """Returns the list of converters to try for a given format."""
         return self.converter_config.get(fmt, CONVERTER_DEFAULTS[fmt])
 
+    def _cache_path(self, kind, filepath, extra=None):
+        """Returns the cache file for a conversion of *filepath*, or None.
+
+        The key covers the file fingerprint, the documix version, the
+        converter configuration and any *extra* JSON-serialisable settings
+        the result depends on, so changing any of them forces a fresh
+        conversion.
+        """
+        if not self.cache_dir:
+            return None
+        from documix import __version__
+        try:
+            fingerprint = _file_fingerprint(filepath)
+        except OSError:
+            return None
+        params = json.dumps([kind, __version__, self.converter_config, extra], sort_keys=True)
+        key = hashlib.blake2b(f"{fingerprint}:{params}".encode(), digest_size=20).hexdigest()
+        return os.path.join(self.cache_dir, kind, f"{key}.json")
+
+    def _cache_load(self, cache_path):
+        """Returns cached (text, method) for *cache_path*, or None on a miss."""
+        if not cache_path or not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            return entry['text'], f"cache+{entry['method']}"
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _cache_store(self, cache_path, text, method):
+        """Atomically writes a conversion result to *cache_path*."""
+        if not cache_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'text': text, 'method': method}, f)
+            os.replace(temp_name, cache_path)
+        except OSError as e:
+            print(f"WARNING: Failed to write conversion cache: {e}")
+
     def is_uvx_available(self):
         """Check if uvx command is available. Result is cached."""
         if self._uvx_available is None:
             try:
-                subprocess.run(
+                _run_tool(
                     ['uvx', '--version'],
                     check=True,
                     stdout=subprocess.PIPE,
@@ -361,7 +689,7 @@ class DocumentCompiler:
         """Check if mineru command is available. Result is cached."""
         if self._mineru_available is None:
             try:
-                subprocess.run(
+                _run_tool(
                     ['mineru', '--version'],
                     check=True,
                     stdout=subprocess.PIPE,
@@ -402,40 +730,55 @@ class DocumentCompiler:
                 self._paddleocr_available = False
         return self._paddleocr_available
 
+    def is_unoconv_available(self):
+        """Check if the unoconv client is installed. Result is cached."""
+        if self._unoconv_available is None:
+            self._unoconv_available = shutil.which('unoconv') is not None
+        return self._unoconv_available
+
+    def _is_excluded(self, filename):
+        """Returns True if *filename* matches any exclusion pattern."""
+        return any(pattern.search(filename) for pattern in self.exclude_patterns)
+
+    def _iter_files(self, path):
+        """Yields a DirEntry for every file under *path*.
+
+        Uses os.scandir so the file type comes from the directory listing
+        instead of a separate stat() per entry. Symlinked directories are not
+        followed, and unreadable or vanished directories are skipped, both
+        matching os.walk.
+        """
+        try:
+            entries = os.scandir(path)
+        except OSError as e:
+            print(f"WARNING: Skipping unreadable directory {path}: {e}")
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if self.recursive:
+                        yield from self._iter_files(entry.path)
+                elif entry.is_file():
+                    yield entry
+
     def collect_files(self):
         """Collects all files to process."""
-        files_to_process = []
-        
         # Handle single file input
         if self.is_single_file:
-            files_to_process = [self.source_path]
-        elif self.recursive:
-            for root, _, files in os.walk(self.source_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    files_to_process.append(file_path)
+            entries = [(self.source_path, os.path.basename(self.source_path))]
         else:
-            files_to_process = [os.path.join(self.source_dir, f) for f in os.listdir(self.source_dir) 
-                              if os.path.isfile(os.path.join(self.source_dir, f))]
+            entries = ((entry.path, entry.name) for entry in self._iter_files(self.source_dir))
         
         # Filter files by extensions and exclusion patterns
         filtered_files = []
         
-        for file_path in files_to_process:
+        for file_path, filename in entries:
             # Check extension
-            _, ext = os.path.splitext(file_path.lower())
-            if ext not in self.include_extensions:
+            ext = os.path.splitext(filename)[1].lower()
+            if ext not in self._include_ext_set:
                 continue
             
-            # Check exclusion patterns
-            filename = os.path.basename(file_path)
-            exclude = False
-            for pattern in self.exclude_patterns:
-                if pattern.search(filename):
-                    exclude = True
-                    break
-            
-            if not exclude:
+            if not self._is_excluded(filename):
                 filtered_files.append(file_path)
         
         # Sort files alphabetically
@@ -471,17 +814,9 @@ class DocumentCompiler:
                     _, ext = os.path.splitext(file_path.lower())
                     
                     # Check if file has an appropriate extension
-                    if ext in self.include_extensions:
-                        # Check exclusion patterns
-                        exclude = False
-                        for pattern in self.exclude_patterns:
-                            if pattern.search(file):
-                                exclude = True
-                                break
-                        
-                        if not exclude:
-                            rel_file_path = os.path.relpath(file_path, self.source_dir)
-                            structure.append(f"  {rel_file_path}")
+                    if ext in self._include_ext_set and not self._is_excluded(file):
+                        rel_file_path = os.path.relpath(file_path, self.source_dir)
+                        structure.append(f"  {rel_file_path}")
         else:
             for file in sorted(os.listdir(self.source_dir)):
                 file_path = os.path.join(self.source_dir, file)
@@ -489,62 +824,21 @@ class DocumentCompiler:
                     _, ext = os.path.splitext(file_path.lower())
                     
                     # Check if file has an appropriate extension
-                    if ext in self.include_extensions:
-                        # Check exclusion patterns
-                        exclude = False
-                        for pattern in self.exclude_patterns:
-                            if pattern.search(file):
-                                exclude = True
-                                break
-                        
-                        if not exclude:
-                            structure.append(f"  {file}")
+                    if ext in self._include_ext_set and not self._is_excluded(file):
+                        structure.append(f"  {file}")
         
         return structure
     
-    def get_file_language(self, file_path):
+    @staticmethod
+    def get_file_language(file_path):
         """Determines programming language based on file extension."""
-        ext = os.path.splitext(file_path.lower())[1]
-        languages = {
-            '.py': 'python',
-            '.rb': 'ruby',
-            '.js': 'javascript',
-            '.html': 'html',
-            '.css': 'css',
-            '.json': 'json',
-            '.yml': 'yaml',
-            '.yaml': 'yaml',
-            '.md': 'markdown',
-            '.txt': 'text',
-            '.sh': 'bash',
-            '.java': 'java',
-            '.c': 'c',
-            '.cpp': 'cpp',
-            '.h': 'c',
-            '.php': 'php',
-            '.sql': 'sql',
-            '.xml': 'xml',
-            '.go': 'go',
-            '.rs': 'rust',
-            '.ts': 'typescript',
-            '.swift': 'swift',
-            '.kt': 'kotlin',
-            '.dart': 'dart',
-            '.pl': 'perl',
-            '.r': 'r',
-            '.lua': 'lua',
-            '.scala': 'scala',
-            '.cs': 'csharp',
-            '.vb': 'vb'
-        }
-        return languages.get(ext, '')
+        return FILE_LANGUAGES.get(os.path.splitext(file_path)[1].lower(), '')
     
     def estimate_tokens(self, text):
-        if not text.strip():
-            return 0
-        tokens = text.strip().split()
-        word_count = len(tokens)
-        if re.search(r'[.!?]$', text.strip()):
+        # str.split() already ignores surrounding whitespace, so the text is
+        # scanned once in C instead of being stripped and regex-searched again
+        word_count = len(text.split())
+        if word_count and text.rstrip()[-1] in '.!?':
             return word_count + 1
         return word_count
 
@@ -791,10 +1085,11 @@ class DocumentCompiler:
             """)
             env = os.environ.copy()
             env['PADDLE_PDX_DISABLE_MODEL_SOURCE_CHECK'] = 'True'
-            proc = subprocess.run(
-                [self._paddleocr_python, '-c', script, filepath],
-                capture_output=True, text=True, timeout=300, env=env,
-            )
+            with self._ml_slots:
+                proc = subprocess.run(
+                    [self._paddleocr_python, '-c', script, filepath],
+                    capture_output=True, text=True, timeout=300, env=env,
+                )
             if proc.returncode != 0:
                 print(f"PaddleOCR failed for {filepath}: {proc.stderr[:500]}")
                 return None, None
@@ -831,11 +1126,12 @@ class DocumentCompiler:
                 'mineru', '-p', filepath, '-o', tmpdir,
                 '-b', 'pipeline', '-d', 'cpu',
             ]
-            subprocess.run(
-                cmd, check=True,
-                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                timeout=120,
-            )
+            with self._ml_slots:
+                _run_tool(
+                    cmd, check=True,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    timeout=120,
+                )
 
             stem = Path(filepath).stem
             md_path = os.path.join(tmpdir, stem, 'auto', f'{stem}.md')
@@ -862,12 +1158,15 @@ class DocumentCompiler:
         if not self.is_uvx_available():
             return None, None
         try:
-            with tempfile.NamedTemporaryFile(suffix='.md', delete=False) as temp:
-                temp_name = temp.name
-            subprocess.run(['uvx', 'markitdown[pdf]', filepath, '-o', temp_name], check=True)
-            with open(temp_name, 'r', encoding='utf-8', errors='replace') as f:
-                text = f.read()
-            os.unlink(temp_name)
+            text = _run_tool(
+                ['uvx', 'markitdown[pdf]', filepath],
+                check=True,
+                stdout=subprocess.PIPE,
+                encoding='utf-8',
+                errors='replace',
+                # markitdown prints with the console encoding; force UTF-8
+                env=dict(os.environ, PYTHONIOENCODING='utf-8')
+            ).stdout
             print(f"Successfully converted PDF using uvx markitdown: {filepath}")
             return text, "markitdown-uvx"
         except (subprocess.SubprocessError, FileNotFoundError):
@@ -877,12 +1176,14 @@ class DocumentCompiler:
     def _try_pdf_markitdown(self, filepath):
         """Try converting PDF using markitdown directly."""
         try:
-            with tempfile.NamedTemporaryFile(suffix='.md', delete=False) as temp:
-                temp_name = temp.name
-            subprocess.run(['markitdown', filepath, '-o', temp_name], check=True)
-            with open(temp_name, 'r', encoding='utf-8', errors='replace') as f:
-                text = f.read()
-            os.unlink(temp_name)
+            text = _run_tool(
+                ['markitdown', filepath],
+                check=True,
+                stdout=subprocess.PIPE,
+                encoding='utf-8',
+                errors='replace',
+                env=dict(os.environ, PYTHONIOENCODING='utf-8')
+            ).stdout
             print(f"Successfully converted PDF using markitdown: {filepath}")
             return text, "markitdown"
         except (subprocess.SubprocessError, FileNotFoundError):
@@ -892,12 +1193,14 @@ class DocumentCompiler:
     def _try_pdf_pdftotext(self, filepath):
         """Try converting PDF using pdftotext."""
         try:
-            with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as temp:
-                temp_name = temp.name
-            subprocess.run(['pdftotext', '-layout', filepath, temp_name], check=True)
-            with open(temp_name, 'r', encoding='utf-8', errors='replace') as f:
-                text = f.read()
-            os.unlink(temp_name)
+            # "-" sends the text to stdout instead of a temporary file
+            text = _run_tool(
+                ['pdftotext', '-layout', '-enc', 'UTF-8', filepath, '-'],
+                check=True,
+                stdout=subprocess.PIPE,
+                encoding='utf-8',
+                errors='replace'
+            ).stdout
             print(f"Successfully converted PDF using pdftotext: {filepath}")
             return text, "pdftotext"
         except (subprocess.SubprocessError, FileNotFoundError):
@@ -908,6 +1211,11 @@ class DocumentCompiler:
         """Converts PDF to text using configured converters.
         Default order: MinerU, pdfplumber, uvx markitdown,
         markitdown, pdftotext, PaddleOCR."""
+        cache_path = self._cache_path('pdf', filepath)
+        cached = self._cache_load(cache_path)
+        if cached:
+            print(f"Using cached PDF conversion: {filepath}")
+            return cached
         dispatch = {
             'paddleocr': self.convert_pdf_with_paddleocr,
             'mineru': self.convert_pdf_with_mineru,
@@ -919,6 +1227,7 @@ class DocumentCompiler:
         for name in self.get_converters('pdf'):
             text, method = dispatch[name](filepath)
             if text is not None:
+                self._cache_store(cache_path, text, method)
                 return text, method
         print(f"WARNING: Failed to convert PDF: {filepath}")
         return f"[Failed to convert PDF file: {os.path.basename(filepath)}]", "failed"
@@ -931,7 +1240,7 @@ class DocumentCompiler:
             with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as temp:
                 temp_name = temp.name
             
-            subprocess.run(['ebook-convert', filepath, temp_name], check=True)
+            _run_tool(['ebook-convert', filepath, temp_name], check=True)
             
             with open(temp_name, 'r', encoding='utf-8', errors='replace') as f:
                 text = f.read()
@@ -949,21 +1258,17 @@ class DocumentCompiler:
     def _try_docx_pandoc(self, filepath):
         """Try converting DOCX using pandoc."""
         try:
-            with tempfile.NamedTemporaryFile(suffix='.md', delete=False) as temp:
-                temp_name = temp.name
             try:
-                subprocess.run(
-                    ['pandoc', '-f', 'docx', '-t', 'markdown', filepath, '-o', temp_name],
+                text = _run_tool(
+                    ['pandoc', '-f', 'docx', '-t', 'markdown', filepath],
                     check=True,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
+                    capture_output=True,
+                    encoding='utf-8',
+                    errors='replace'
+                ).stdout
             except subprocess.CalledProcessError as e:
                 print(f"WARNING: Pandoc error: {e.stderr}")
                 raise
-            with open(temp_name, 'r', encoding='utf-8', errors='replace') as f:
-                text = f.read()
-            os.unlink(temp_name)
             print(f"Successfully converted DOCX using pandoc: {filepath}")
             return text, "pandoc"
         except (subprocess.SubprocessError, FileNotFoundError) as e:
@@ -1001,9 +1306,69 @@ class DocumentCompiler:
         print(f"WARNING: Failed to convert DOCX: {filepath}")
         return f"[Failed to convert DOCX file: {os.path.basename(filepath)}]", "failed"
 
+    @contextlib.contextmanager
+    def _soffice_slot(self):
+        """Holds one LibreOffice slot; yields its profile dir, or None for the default.
+
+        With a single slot soffice simply uses the user's profile. Otherwise
+        each slot's private profile is reused by every later conversion in
+        that slot, so LibreOffice's first-run setup is paid once per slot
+        rather than once per call, and is removed with the other temp dirs.
+        """
+        slot = self._soffice_slots.get()
+        try:
+            if len(self._soffice_profiles) == 1:
+                yield None
+            else:
+                if self._soffice_profiles[slot] is None:
+                    self._soffice_profiles[slot] = tempfile.mkdtemp(prefix='documix-soffice-')
+                    self.temp_dirs.append(self._soffice_profiles[slot])
+                yield self._soffice_profiles[slot]
+        finally:
+            self._soffice_slots.put(slot)
+
+    def _run_soffice_convert(self, doc_paths, outdir):
+        """Converts the files in *doc_paths* to DOCX in *outdir* using LibreOffice.
+
+        Uses the shared soffice listener through unoconv when available,
+        one conversion at a time, otherwise spawns a one-shot soffice process
+        once a LibreOffice slot is free. If unoconv fails (e.g. a broken
+        pyuno), the listener is disabled and one-shot soffice is used from
+        then on. Raises CalledProcessError if the conversion fails.
+        """
+        run = functools.partial(_run_tool, check=True, stderr=subprocess.PIPE,
+                                stdout=subprocess.PIPE, text=True)
+        connection = _SOFFICE_DAEMON.connection() if self.is_unoconv_available() else None
+        if connection:
+            try:
+                with _SOFFICE_DAEMON.convert_lock:
+                    return run(['unoconv', '--connection', connection, '-f', 'docx', '-o', outdir, *doc_paths])
+            except (subprocess.SubprocessError, OSError) as e:
+                print(f"WARNING: unoconv conversion failed, using one-shot soffice: {e}")
+                _SOFFICE_DAEMON.disable()
+        with self._soffice_slot() as profile_dir:
+            cmd = ['soffice', '--convert-to', 'docx', '--outdir', outdir, *doc_paths]
+            if profile_dir:
+                cmd.insert(1, f'-env:UserInstallation={Path(profile_dir).as_uri()}')
+            return run(cmd)
+
     def convert_doc_to_text(self, filepath):
         """Converts DOC to DOCX using LibreOffice soffice command, then processes as DOCX."""
         conversion_method = "unknown"
+        cache_path = self._cache_path('doc', filepath)
+        cached = self._cache_load(cache_path)
+        if cached:
+            print(f"Using cached DOC conversion: {filepath}")
+            return cached
+        try:
+            problem = _doc_input_problem(filepath)
+        except OSError as e:
+            problem = str(e)
+        if problem:
+            # Rejected before LibreOffice was involved, so no install hint
+            print(f"WARNING: Failed to convert DOC: {filepath}")
+            print(f"Error details: {problem}")
+            return f"[Failed to convert DOC file: {os.path.basename(filepath)}]", "failed"
         try:
             # Create a temporary directory for conversion
             temp_dir = tempfile.mkdtemp()
@@ -1029,13 +1394,7 @@ class DocumentCompiler:
             
             # Convert DOC to DOCX using LibreOffice with error capturing
             try:
-                result = subprocess.run(
-                    ['soffice', '--convert-to', 'docx', '--outdir', temp_dir, temp_doc], 
-                    check=True,
-                    stderr=subprocess.PIPE,
-                    stdout=subprocess.PIPE,
-                    text=True
-                )
+                result = self._run_soffice_convert([temp_doc], temp_dir)
                 print(f"LibreOffice conversion successful: {result.stdout}")
             except subprocess.CalledProcessError as e:
                 print(f"WARNING: LibreOffice conversion error: {e.stderr}")
@@ -1049,30 +1408,88 @@ class DocumentCompiler:
             text, docx_method = self.convert_docx_to_text(output_docx)
             
             conversion_method = f"soffice+{docx_method}"
+            if docx_method != "failed":
+                self._cache_store(cache_path, text, conversion_method)
             print(f"Successfully converted DOC using {conversion_method}: {filepath}")
             return text, conversion_method
             
-        except (subprocess.SubprocessError, FileNotFoundError, ValueError) as e:
+        except (subprocess.SubprocessError, OSError, ValueError) as e:
             print(f"WARNING: Failed to convert DOC: {filepath}")
             print(f"Error details: {str(e)}")
             print("Make sure you have LibreOffice installed")
             conversion_method = "failed"
             return f"[Failed to convert DOC file: {os.path.basename(filepath)}]", conversion_method
 
+    def convert_docs_to_text_batch(self, paths):
+        """Converts several DOC files with a single LibreOffice invocation.
+
+        Starting LibreOffice costs far more than converting a typical DOC
+        file, so the files are copied into one directory and converted
+        together. Returns a dict mapping each path to (text, method); files
+        that are cached, empty, not Word documents or missing from the batch
+        output go through convert_doc_to_text individually.
+        """
+        results = {}
+        pending = []
+        for path in paths:
+            cached = self._cache_load(self._cache_path('doc', path))
+            if cached:
+                print(f"Using cached DOC conversion: {path}")
+                results[path] = cached
+            else:
+                try:
+                    if _doc_input_problem(path) is None:
+                        pending.append(path)
+                except OSError:
+                    pass
+
+        if len(pending) > 1:
+            temp_dir = tempfile.mkdtemp()
+            self.temp_dirs.append(temp_dir)
+            # Numbered copies avoid collisions between files with the same name
+            temp_docs = []
+            for i, path in enumerate(pending):
+                temp_doc = os.path.join(temp_dir, f"{i}.doc")
+                shutil.copy2(path, temp_doc)
+                temp_docs.append(temp_doc)
+
+            print(f"Converting {len(pending)} DOC files in one LibreOffice batch")
+            try:
+                self._run_soffice_convert(temp_docs, temp_dir)
+            except (subprocess.SubprocessError, FileNotFoundError) as e:
+                print(f"WARNING: LibreOffice batch conversion failed: {e}")
+
+            for i, path in enumerate(pending):
+                output_docx = os.path.join(temp_dir, f"{i}.docx")
+                if not os.path.exists(output_docx):
+                    continue
+                text, docx_method = self.convert_docx_to_text(output_docx)
+                if docx_method == "failed":
+                    continue
+                conversion_method = f"soffice+{docx_method}"
+                self._cache_store(self._cache_path('doc', path), text, conversion_method)
+                print(f"Successfully converted DOC using {conversion_method}: {path}")
+                results[path] = text, conversion_method
+
+        for path in paths:
+            if path not in results:
+                results[path] = self.convert_doc_to_text(path)
+        return results
+
     def _try_rtf_pandoc(self, filepath):
         """Try converting RTF using pandoc."""
+        if not _have_tool('pandoc'):
+            print(f"pandoc not available for RTF: {filepath}")
+            return None, None
         try:
-            with tempfile.NamedTemporaryFile(suffix='.md', delete=False) as temp:
-                temp_name = temp.name
-            subprocess.run(
-                ['pandoc', '-f', 'rtf', '-t', 'markdown', filepath, '-o', temp_name],
+            # pandoc writes to stdout when no -o is given
+            text = _run_tool(
+                ['pandoc', '-f', 'rtf', '-t', 'markdown', filepath],
                 check=True,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            with open(temp_name, 'r', encoding='utf-8', errors='replace') as f:
-                text = f.read()
-            os.unlink(temp_name)
+                capture_output=True,
+                encoding='utf-8',
+                errors='replace'
+            ).stdout
             print(f"Successfully converted RTF using pandoc: {filepath}")
             return text, "pandoc"
         except (subprocess.SubprocessError, FileNotFoundError):
@@ -1081,8 +1498,11 @@ class DocumentCompiler:
 
     def _try_rtf_unrtf(self, filepath):
         """Try converting RTF using unrtf."""
+        if not _have_tool('unrtf'):
+            print(f"unrtf not available for RTF: {filepath}")
+            return None, None
         try:
-            result = subprocess.run(
+            result = _run_tool(
                 ['unrtf', '--text', filepath],
                 check=True,
                 capture_output=True,
@@ -1129,8 +1549,22 @@ class DocumentCompiler:
         """Reads text from TXT/MD/other text files."""
         conversion_method = "unknown"
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                text = f.read()
+            with open(filepath, 'rb') as f:
+                text = None
+                if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+                    # Decode straight from the page cache instead of copying
+                    # the file into a buffer first
+                    try:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            text = str(mm, 'utf-8', 'replace')
+                    except (ValueError, OSError):
+                        # Some special and network filesystems cannot be mapped
+                        pass
+                if text is None:
+                    text = f.read().decode('utf-8', 'replace')
+            # Match text-mode reads, which translate all line endings to \n
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
             conversion_method = "direct_read"
             print(f"Successfully read text file using direct read: {filepath}")
             return text, conversion_method
@@ -1143,6 +1577,12 @@ class DocumentCompiler:
     def extract_zip(self, filepath):
         """Extracts a ZIP file and processes its contents."""
         conversion_method = "unknown"
+        # Which members get extracted depends on the included extensions
+        cache_path = self._cache_path('zip', filepath, extra=sorted(self._include_ext_set))
+        cached = self._cache_load(cache_path)
+        if cached:
+            print(f"Using cached ZIP extraction: {filepath}")
+            return cached
         try:
             # Create a temporary directory for ZIP extraction
             temp_dir = tempfile.mkdtemp()
@@ -1150,56 +1590,65 @@ class DocumentCompiler:
             
             print(f"📦 Extracting ZIP: {os.path.basename(filepath)}")
             
-            # Extract the ZIP file
+            # Extract only the members that will be processed; the rest are
+            # just listed, so they never touch the disk
             with zipfile.ZipFile(filepath, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
+                members = sorted((info for info in zip_ref.infolist() if not info.is_dir()),
+                                 key=lambda info: info.filename)
+                extracted = {}
+                for info in members:
+                    ext = os.path.splitext(info.filename.lower())[1]
+                    if ext in self._include_ext_set and info.file_size <= MAX_ZIP_MEMBER_SIZE:
+                        extracted[info.filename] = zip_ref.extract(info, temp_dir)
             
             # Create a summary of ZIP contents
-            file_list = []
-            zip_content_summary = f"# ZIP Archive Contents: {os.path.basename(filepath)}\n\n"
-            zip_content_summary += "## Files in archive:\n\n"
-            
-            # Walk through the extracted directory
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(file_path, temp_dir)
-                    file_list.append(rel_path)
+            file_list = [info.filename for info in members]
+            summary_parts = [f"# ZIP Archive Contents: {os.path.basename(filepath)}\n\n",
+                             "## Files in archive:\n\n"]
             
-            # Sort the file list for a clean representation
-            file_list.sort()
             for file in file_list:
-                zip_content_summary += f"- {file}\n"
+                summary_parts.append(f"- {file}\n")
             
             # Process each file in the ZIP archive
-            zip_content_summary += "\n## Extracted file contents:\n\n"
+            summary_parts.append("\n## Extracted file contents:\n\n")
             
             extraction_methods = []
-            for file_path in file_list:
-                full_path = os.path.join(temp_dir, file_path)
+            had_errors = False
+            for info in members:
+                file_path = info.filename
                 _, ext = os.path.splitext(file_path.lower())
                 
                 # Process only if file extension is in include list
-                if ext in self.include_extensions:
-                    zip_content_summary += f"### File: {file_path}\n\n"
+                if ext in self._include_ext_set:
+                    summary_parts.append(f"### File: {file_path}\n\n")
+                    
+                    if file_path not in extracted:
+                        summary_parts.append(f"[Skipped: file is larger than "
+                                             f"{MAX_ZIP_MEMBER_SIZE // (1024 * 1024)} MB uncompressed]\n\n")
+                        continue
                     
                     # Get file content
                     try:
-                        content, method = self.process_file(full_path)
+                        content, method = self.process_file(extracted[file_path])
                         extraction_methods.append(method)
                         
                         # Add file content as a code block with appropriate language
                         file_language = self.get_file_language(file_path)
                         if file_language:
-                            zip_content_summary += f"```{file_language}\n{content}\n```\n\n"
+                            summary_parts.append(f"```{file_language}\n{content}\n```\n\n")
                         else:
-                            zip_content_summary += f"```\n{content}\n```\n\n"
+                            summary_parts.append(f"```\n{content}\n```\n\n")
                     except Exception as e:
-                        zip_content_summary += f"[Error processing file: {str(e)}]\n\n"
+                        summary_parts.append(f"[Error processing file: {str(e)}]\n\n")
+                        had_errors = True
             
             conversion_method = "zip_extract+" + "+".join(set(extraction_methods))
+            text = "".join(summary_parts)
+            # Only cache archives whose members all converted cleanly
+            if not had_errors and not any(m.startswith("failed") for m in extraction_methods):
+                self._cache_store(cache_path, text, conversion_method)
             print(f"Successfully processed ZIP using extraction methods: {conversion_method}: {filepath}")
-            return zip_content_summary, conversion_method
+            return text, conversion_method
             
         except zipfile.BadZipFile:
             conversion_method = "failed-bad_zip"
@@ -1343,19 +1792,20 @@ class DocumentCompiler:
             
             # Get email content
             email_content, attachments = email_processor.compile_output()
+            email_parts = [email_content]
             
             # Store attachment info
             email_info['attachments'] = attachments
             
             # Process each attachment
             if attachments:
-                email_content += "\n"
+                email_parts.append("\n")
                 for i, attachment in enumerate(attachments, 1):
                     att_path = attachment['path']
                     att_name = attachment['filename']
                     att_size = email_processor.format_size(attachment['size'])
                     
-                    email_content += f"### {i}. {att_name} ({att_size})\n\n"
+                    email_parts.append(f"### {i}. {att_name} ({att_size})\n\n")
                     
                     # Check if attachment can be processed
                     _, ext = os.path.splitext(att_path.lower())
@@ -1367,56 +1817,128 @@ class DocumentCompiler:
                             # PDF/ZIP content is already markdown, don't wrap
                             att_ext = os.path.splitext(att_path.lower())[1]
                             if att_ext in ('.pdf', '.zip'):
-                                email_content += f"{content}\n\n"
+                                email_parts.append(f"{content}\n\n")
                             else:
                                 file_language = self.get_file_language(att_path)
                                 if file_language:
-                                    email_content += f"```{file_language}\n{content}\n```\n\n"
+                                    email_parts.append(f"```{file_language}\n{content}\n```\n\n")
                                 else:
-                                    email_content += f"```\n{content}\n```\n\n"
+                                    email_parts.append(f"```\n{content}\n```\n\n")
                         except Exception as e:
-                            email_content += f"[Error processing attachment: {str(e)}]\n\n"
+                            email_parts.append(f"[Error processing attachment: {str(e)}]\n\n")
                     else:
-                        email_content += f"[Attachment type '{ext}' not supported for extraction]\n\n"
+                        email_parts.append(f"[Attachment type '{ext}' not supported for extraction]\n\n")
             
             # Add statistics
-            email_content += "\n---\n## Statistics\n"
-            email_content += f"- Total attachments: {len(attachments)}\n"
+            email_parts.append("\n---\n## Statistics\n")
+            email_parts.append(f"- Total attachments: {len(attachments)}\n")
             if attachments:
                 total_size = sum(att['size'] for att in attachments)
-                email_content += f"- Total size: {email_processor.format_size(total_size)}\n"
-            email_content += f"- Processing time: {time.time() - start_time:.2f}s\n"
+                email_parts.append(f"- Total size: {email_processor.format_size(total_size)}\n")
+            email_parts.append(f"- Processing time: {time.time() - start_time:.2f}s\n")
             
             conversion_method = f"email+{email_processor.metadata.get('attachments_source', 'unknown').lower().replace(' ', '_')}"
-            return email_content, conversion_method, email_info
+            return "".join(email_parts), conversion_method, email_info
             
         except Exception as e:
             print(f"ERROR: Failed to process email {filepath}: {str(e)}")
             conversion_method = "failed-exception"
             return f"[Error processing email file: {str(e)}]", conversion_method, {}
     
+    def convert_eml_to_text(self, filepath):
+        """Processes an email file, returning only its content and method."""
+        content, conversion_method, _ = self.process_email(filepath)
+        return content, conversion_method
+
     def process_file(self, file_path):
         """Processes a single file and returns its content and conversion method used."""
-        ext = os.path.splitext(file_path.lower())[1]
+        ext = os.path.splitext(file_path)[1].lower()
+        handler = FILE_HANDLERS.get(ext)
+        if handler:
+            return getattr(self, handler)(file_path)
         
-        if ext == '.pdf':
-            return self.convert_pdf_to_text(file_path)
-        elif ext == '.epub':
-            return self.convert_epub_to_text(file_path)
-        elif ext == '.docx':
-            return self.convert_docx_to_text(file_path)
-        elif ext == '.doc':
-            return self.convert_doc_to_text(file_path)
-        elif ext == '.rtf':
-            return self.convert_rtf_to_text(file_path)
-        elif ext == '.zip':
-            return self.extract_zip(file_path)
-        elif ext == '.eml':
-            content, method, _ = self.process_email(file_path)
-            return content, method
-        else:  # .txt, .md, .py, etc.
-            return self.convert_txt_to_text(file_path)
+        # .txt, .md, .py, etc. Extensions without a known language may be
+        # binary blobs picked up through --extensions; don't decode those
+        if ext not in FILE_LANGUAGES:
+            try:
+                if _looks_binary(file_path):
+                    print(f"Skipping binary file: {file_path}")
+                    return f"[Binary file skipped: {os.path.basename(file_path)}]", "skipped"
+            except OSError:
+                pass
+        return self.convert_txt_to_text(file_path)
     
+    def _process_files(self, files):
+        """Processes files, yielding (file_path, content, conversion_method).
+
+        Conversions are mostly spent waiting on external tools, so with
+        jobs > 1 they run in a thread pool. Plain-text files get their own
+        pool of TEXT_READERS_PER_JOB threads per job (at most
+        TEXT_READ_WORKERS), so their reads overlap with each
+        other instead of queueing behind slow conversions. Only
+        PROCESS_WINDOW_PER_WORKER files per worker are in flight at once, so
+        memory stays bounded however large the corpus is. Results are
+        always yielded in the order of *files* so the output is
+        deterministic.
+        """
+        # Group DOC files so each LibreOffice start converts several of them
+        doc_files = [f for f in files if os.path.splitext(f)[1].lower() == '.doc']
+        batches = {}
+        if len(doc_files) > 1:
+            for i in range(0, len(doc_files), SOFFICE_BATCH_SIZE):
+                batch = tuple(doc_files[i:i + SOFFICE_BATCH_SIZE])
+                for file_path in batch:
+                    batches[file_path] = batch
+
+        if self.jobs == 1 or len(files) < 2:
+            batch_results = {}
+            for file_path in files:
+                print(f"⚙️  Processing: {os.path.relpath(file_path, self.source_dir)}")
+                batch = batches.get(file_path)
+                if batch:
+                    if batch not in batch_results:
+                        batch_results[batch] = self.convert_docs_to_text_batch(list(batch))
+                    content, conversion_method = batch_results[batch][file_path]
+                else:
+                    content, conversion_method = self.process_file(file_path)
+                yield file_path, content, conversion_method
+            return
+
+        window = PROCESS_WINDOW_PER_WORKER * (self.jobs + self._read_workers)
+        batch_futures = {}
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor, \
+             ThreadPoolExecutor(max_workers=self._read_workers) as reader:
+
+            def submit(file_path):
+                batch = batches.get(file_path)
+                if batch:
+                    if batch not in batch_futures:
+                        batch_futures[batch] = executor.submit(self.convert_docs_to_text_batch, list(batch))
+                    return batch_futures[batch]
+                if os.path.splitext(file_path)[1].lower() in FILE_HANDLERS:
+                    return executor.submit(self.process_file, file_path)
+                return reader.submit(self.process_file, file_path)
+
+            def finish(file_path, future):
+                print(f"⚙️  Processing: {os.path.relpath(file_path, self.source_dir)}")
+                result = future.result()
+                batch = batches.get(file_path)
+                if batch:
+                    # Batch results are held until the batch's last file is out
+                    if file_path == batch[-1]:
+                        del batch_futures[batch]
+                    return (file_path, *result[file_path])
+                return (file_path, *result)
+
+            queued = deque()
+            for file_path in files:
+                queued.append((file_path, submit(file_path)))
+                if len(queued) > window:
+                    yield finish(*queued.popleft())
+            while queued:
+                yield finish(*queued.popleft())
+
     def compile(self):
         """Compiles all documents into a single Markdown file."""
         # Start time measurement
@@ -1448,7 +1970,7 @@ class DocumentCompiler:
         structure = self.get_directory_structure()
         
         try:
-            with open(self.output_file, 'w', encoding='utf-8') as out_file:
+            with open(self.output_file, 'w', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as out_file:
                 # Use appropriate format based on mode
                 if processing_mode == 'single_email':
                     # Process the single email and use special format
@@ -1528,15 +2050,10 @@ class DocumentCompiler:
                 # File contents
                 out_file.write("# Files\n\n")
                 
-                for file_path in filtered_files:
+                for file_path, content, conversion_method in self._process_files(filtered_files):
                     rel_path = os.path.relpath(file_path, self.source_dir)
                     file_language = self.get_file_language(file_path)
                     
-                    print(f"⚙️  Processing: {rel_path}")
-                    
-                    # File content
-                    content, conversion_method = self.process_file(file_path)
-                    
                     # File header with conversion method
                     out_file.write(f"## File: {rel_path} (converted with {conversion_method})\n")
                     
@@ -1618,6 +2135,8 @@ class DocumentCompiler:
                     shutil.rmtree(temp_dir)
                 except Exception:
                     pass
+            # The soffice profiles went with them; a later run makes new ones
+            self._soffice_profiles = [None] * len(self._soffice_profiles)
 
 def check_converter_availability():
     """Check which converters are available on this system.
@@ -1635,7 +2154,7 @@ def check_converter_availability():
         available['pdf'].append('pdfplumber')
     # markitdown-uvx: need uvx
     try:
-        subprocess.run(
+        _run_tool(
             ['uvx', '--version'], check=True,
             stdout=subprocess.PIPE, stderr=subprocess.PIPE
         )
@@ -2012,6 +2531,12 @@ def main():
     parser.add_argument('--rtf-converters',
         help='RTF converters to try, in order (comma-separated). '
              'Choices: pandoc,unrtf,striprtf')
+    parser.add_argument('--cache', nargs='?', const=CACHE_DEFAULT_DIR, metavar='DIR',
+        help='Cache PDF/DOC conversions and ZIP extractions and reuse them for unchanged files '
+             f'(default directory: {CACHE_DEFAULT_DIR})')
+    parser.add_argument('-j', '--jobs', type=int, metavar='N',
+        help='Number of files to convert in parallel (default: number of CPUs; '
+             'MinerU and PaddleOCR still run one at a time)')
 
     args = parser.parse_args()
     
@@ -2060,6 +2585,9 @@ def main():
             converter_config[fmt] = names
             print(f"🔧 {fmt.upper()} converters: {', '.join(names)}")
 
+    if args.cache:
+        print(f"💾 Conversion cache: {args.cache}")
+
     print_converter_info(converter_config)
 
     compiler = DocumentCompiler(
@@ -2069,7 +2597,9 @@ def main():
         include_extensions,
         exclude_patterns,
         force_format,
-        converter_config
+        converter_config,
+        cache_dir=args.cache,
+        jobs=args.jobs
     )
 
     compiler.compile()
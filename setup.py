@@ -38,5 +38,6 @@ setup(
         "pdf": ["markitdown"],
         "tables": ["pdfplumber"],
         "paddleocr": ["paddleocr[doc-parser]", "paddlepaddle>=3.0.0"],
+        "dev": ["pytest", "pytest-xdist"],
     },
 )
\ No newline at end of file
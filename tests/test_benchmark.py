@@ -6,8 +6,6 @@ import shutil
 import unittest
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from documix.documix import (
     check_converter_availability,
     word_similarity,
@@ -17,7 +15,7 @@ from documix.documix import (
     main,
     CONVERTER_DEFAULTS,
 )
-from tests.conftest import get_fastest_converter_config, RANKING_PATH
+from tests.conftest import discard_dir, get_fastest_converter_config, RANKING_PATH
 
 
 class TestWordSimilarity(unittest.TestCase):
@@ -150,7 +148,7 @@ class TestRunBenchmark(unittest.TestCase):
             f.write('%PDF-1.4 fake')
 
     def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+        discard_dir(self.temp_dir)
 
     @patch('documix.documix.check_converter_availability')
     @patch.object(
@@ -239,7 +237,7 @@ class TestBenchmarkEdgePaths(unittest.TestCase):
             f.write('%PDF-1.4 fake')
 
     def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+        discard_dir(self.temp_dir)
 
     @patch('documix.documix.check_converter_availability')
     def test_benchmark_converter_exception(self, mock_avail):
@@ -1,14 +1,11 @@
 """Tests for CLI functionality in DocumentCompiler."""
 
 import os
-import sys
 import tempfile
 import unittest
 from io import StringIO
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from documix.documix import main
 from documix import __version__
 
@@ -1,18 +1,14 @@
 import os
-import sys
 import unittest
 import tempfile
 import shutil
-import hashlib
 import time
 import filecmp
 import subprocess
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to sys.path to import documix
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
-from documix.documix import DocumentCompiler, DOCX2TXT_AVAILABLE
+from tests.conftest import discard_dir, file_checksum, tool_available
+from documix.documix import DocumentCompiler, DOCX2TXT_AVAILABLE, _tool_path
 
 
 class TestConversionSafety(unittest.TestCase):
@@ -80,25 +76,15 @@ class TestConversionSafety(unittest.TestCase):
     def tearDown(self):
         """Tear down test fixtures."""
         # Clean up temporary directory
-        shutil.rmtree(self.temp_dir)
+        discard_dir(self.temp_dir)
     
     def get_file_checksum(self, filepath):
-        """Get MD5 checksum of a file."""
-        hasher = hashlib.md5()
-        with open(filepath, 'rb') as file:
-            buf = file.read()
-            hasher.update(buf)
-        return hasher.hexdigest()
+        """Get SHA-256 checksum of a file."""
+        return file_checksum(filepath)
     
     def test_doc_conversion_with_soffice_preserves_original(self):
         """Test that DOC to DOCX conversion using LibreOffice doesn't modify the original file."""
-        # Skip if LibreOffice is not installed
-        try:
-            subprocess.run(['soffice', '--version'], 
-                          check=True, 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE)
-        except (subprocess.SubprocessError, FileNotFoundError):
+        if not tool_available('soffice'):
             self.skipTest("LibreOffice not installed or not in PATH")
         
         # First ensure the test file exists
@@ -129,15 +115,7 @@ class TestConversionSafety(unittest.TestCase):
     
     def test_pdf_conversion_with_markitdown_preserves_original(self):
         """Test that PDF conversion with markitdown doesn't modify the original file."""
-        # Check if markitdown is available
-        try:
-            subprocess.run(['markitdown', '--version'], 
-                          check=True, 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE)
-            markitdown_available = True
-        except (subprocess.SubprocessError, FileNotFoundError):
-            markitdown_available = False
+        if not tool_available('markitdown'):
             self.skipTest("markitdown not available to test")
         
         # First ensure the test file exists
@@ -152,10 +130,10 @@ class TestConversionSafety(unittest.TestCase):
         original_run = subprocess.run
 
         def mock_subprocess_run(args, **kwargs):
-            if args[0] == 'uvx':
+            if os.path.basename(args[0]) == 'uvx':
                 # Make uvx fail to force direct markitdown path
                 raise FileNotFoundError("Mock failure of uvx")
-            if args[0] == 'pdftotext':
+            if os.path.basename(args[0]) == 'pdftotext':
                 # Make pdftotext fail
                 raise FileNotFoundError("Mock failure of pdftotext")
             # Let other calls proceed with the real subprocess.run
@@ -192,15 +170,7 @@ class TestConversionSafety(unittest.TestCase):
     
     def test_pdf_conversion_with_pdftotext_preserves_original(self):
         """Test that PDF conversion with pdftotext doesn't modify the original file."""
-        # Check if pdftotext is available
-        try:
-            subprocess.run(['pdftotext', '-v'], 
-                          check=True, 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE)
-            pdftotext_available = True
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pdftotext_available = False
+        if not tool_available('pdftotext', '-v'):
             self.skipTest("pdftotext not available to test")
         
         # First ensure the test file exists
@@ -215,10 +185,10 @@ class TestConversionSafety(unittest.TestCase):
         original_run = subprocess.run
 
         def mock_subprocess_run(args, **kwargs):
-            if args[0] == 'uvx':
+            if os.path.basename(args[0]) == 'uvx':
                 # Make uvx fail to force fallback paths
                 raise FileNotFoundError("Mock failure of uvx")
-            if args[0] == 'markitdown':
+            if os.path.basename(args[0]) == 'markitdown':
                 # Make markitdown fail
                 raise FileNotFoundError("Mock failure of markitdown")
             # Let other calls proceed with the real subprocess.run
@@ -255,6 +225,11 @@ class TestConversionSafety(unittest.TestCase):
 
     def test_pdf_conversion_uvx_markitdown_uses_pdf_extra(self):
         """Test that uvx markitdown is called with [pdf] extra for PDF dependencies."""
+        # Resolve uvx afresh under plain unittest too, where the conftest
+        # autouse fixture does not run
+        _tool_path.cache_clear()
+        self.addCleanup(_tool_path.cache_clear)
+
         # First ensure the test file exists
         self.assertTrue(os.path.exists(self.pdf_test_file),
                        f"Test PDF file not found at {self.pdf_test_file}")
@@ -267,19 +242,12 @@ class TestConversionSafety(unittest.TestCase):
             called_commands.append(list(args))
 
             # For uvx --version check, return success
-            if args[0] == 'uvx' and args[1] == '--version':
+            if os.path.basename(args[0]) == 'uvx' and args[1] == '--version':
                 return MagicMock(returncode=0)
 
-            # For uvx markitdown[pdf] command, simulate success by creating output
-            if args[0] == 'uvx' and 'markitdown' in args[1]:
-                # Find the output file path (-o flag)
-                if '-o' in args:
-                    output_idx = args.index('-o') + 1
-                    output_file = args[output_idx]
-                    # Create a mock output file
-                    with open(output_file, 'w') as f:
-                        f.write("# Converted PDF content\nMock content")
-                return MagicMock(returncode=0)
+            # For uvx markitdown[pdf] command, simulate success on stdout
+            if os.path.basename(args[0]) == 'uvx' and 'markitdown' in args[1]:
+                return MagicMock(returncode=0, stdout="# Converted PDF content\nMock content")
 
             # Fail other commands to ensure uvx path is tested
             raise FileNotFoundError(f"Mock: command not found: {args[0]}")
@@ -300,7 +268,7 @@ class TestConversionSafety(unittest.TestCase):
 
         # Verify that uvx markitdown[pdf] was called (not just markitdown)
         uvx_markitdown_calls = [cmd for cmd in called_commands
-                                if len(cmd) >= 2 and cmd[0] == 'uvx' and 'markitdown' in cmd[1]]
+                                if len(cmd) >= 2 and os.path.basename(cmd[0]) == 'uvx' and 'markitdown' in cmd[1]]
 
         self.assertTrue(len(uvx_markitdown_calls) > 0,
                        "Expected uvx markitdown to be called")
@@ -317,15 +285,7 @@ class TestConversionSafety(unittest.TestCase):
         if not self.docx_test_file or not os.path.exists(self.docx_test_file):
             self.skipTest("DOCX test file not available")
         
-        # Check if pandoc is available
-        try:
-            subprocess.run(['pandoc', '--version'], 
-                          check=True, 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE)
-            pandoc_available = True
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pandoc_available = False
+        if not tool_available('pandoc'):
             self.skipTest("pandoc not available to test")
         
         # Force pandoc to be used by mocking docx2txt to be unavailable
@@ -363,7 +323,7 @@ class TestConversionSafety(unittest.TestCase):
         
         # Force docx2txt to be used by mocking pandoc to fail
         def mock_subprocess_run(args, **kwargs):
-            if args[0] == 'pandoc':
+            if os.path.basename(args[0]) == 'pandoc':
                 # Make pandoc fail
                 raise FileNotFoundError("Mock failure of pandoc")
             # Let other calls proceed normally
@@ -1,41 +1,49 @@
+import contextlib
+import io
 import os
-import sys
 import unittest
 import tempfile
 import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to sys.path to import documix
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from tests.conftest import discard_dir, tool_available, write_zip
+from documix.documix import DocumentCompiler, _SofficeDaemon, _run_tool, _tool_path
 
-from documix.documix import DocumentCompiler
+# OLE2 header of a Word 97-2003 file, enough to pass the signature check
+OLE2_HEADER = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
 
 
 class TestDocConversion(unittest.TestCase):
     """Tests for document conversion functionality."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests in the class."""
         # Create temporary directory for output
-        self.temp_dir = tempfile.mkdtemp()
-        self.output_file = os.path.join(self.temp_dir, 'output.md')
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.output_file = os.path.join(cls.temp_dir, 'output.md')
         
         # Path to sample doc file
-        self.doc_file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 
-                                             '..', 'resources', 'one_megabyte', 'example_1mb.doc'))
+        cls.doc_file_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 
+                                            '..', 'resources', 'one_megabyte', 'example_1mb.doc'))
         
         # Create a DocumentCompiler instance
-        self.compiler = DocumentCompiler(
-            source_path=os.path.dirname(self.doc_file_path),
-            output_file=self.output_file,
+        cls.compiler = DocumentCompiler(
+            source_path=os.path.dirname(cls.doc_file_path),
+            output_file=cls.output_file,
             recursive=False
         )
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Tear down test fixtures."""
         # Clean up temporary directory
-        shutil.rmtree(self.temp_dir)
+        shutil.rmtree(cls.temp_dir)
 
     def test_doc_exists(self):
         """Test that the sample doc file exists."""
@@ -44,13 +52,7 @@ class TestDocConversion(unittest.TestCase):
 
     def test_doc_to_text_conversion(self):
         """Test conversion of DOC to text."""
-        # Skip if LibreOffice is not installed
-        try:
-            subprocess.run(['soffice', '--version'], 
-                          check=True, 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE)
-        except (subprocess.SubprocessError, FileNotFoundError):
+        if not tool_available('soffice'):
             self.skipTest("LibreOffice not installed or not in PATH")
         
         # Try converting the file
@@ -73,13 +75,7 @@ class TestDocConversion(unittest.TestCase):
 
     def test_process_doc_file(self):
         """Test that DOC files are correctly processed through the process_file method."""
-        # Skip if LibreOffice is not installed
-        try:
-            subprocess.run(['soffice', '--version'], 
-                          check=True, 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE)
-        except (subprocess.SubprocessError, FileNotFoundError):
+        if not tool_available('soffice'):
             self.skipTest("LibreOffice not installed or not in PATH")
         
         # Process the file
@@ -105,28 +101,8 @@ class TestDocConversion(unittest.TestCase):
         # For testing, we'll just verify the markitdown fallback logic works
         # without actually creating a test PDF file
         
-        # Check if markitdown is available
-        try:
-            subprocess.run(['markitdown', '--version'], 
-                          check=True, 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE)
-            markitdown_available = True
-        except (subprocess.SubprocessError, FileNotFoundError):
-            markitdown_available = False
-            
-        # Check if pdftotext is available
-        try:
-            subprocess.run(['pdftotext', '-v'], 
-                          check=True, 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE)
-            pdftotext_available = True
-        except (subprocess.SubprocessError, FileNotFoundError):
-            pdftotext_available = False
-            
-        # If neither tool is available, skip the test
-        if not markitdown_available and not pdftotext_available:
+        # If neither markitdown nor pdftotext is available, skip the test
+        if not tool_available('markitdown') and not tool_available('pdftotext', '-v'):
             self.skipTest("Neither markitdown nor pdftotext available")
         
         # Mock the PDF file path - this is just to test the function logic
@@ -150,8 +126,7 @@ class TestDOCConversionEdgeCases(unittest.TestCase):
 
     def tearDown(self):
         """Clean up temp files."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        discard_dir(self.temp_dir)
 
     def test_doc_conversion_empty_file(self):
         """Test that empty DOC files are handled gracefully."""
@@ -169,6 +144,34 @@ class TestDOCConversionEdgeCases(unittest.TestCase):
         self.assertIn('Failed to convert DOC', content)
         self.assertEqual(method, 'failed')
 
+    def test_doc_conversion_bad_signature_skips_soffice(self):
+        """Files that are not Word documents fail without starting LibreOffice."""
+        doc_file = os.path.join(self.temp_dir, 'fake.doc')
+        with open(doc_file, 'wb') as f:
+            f.write(b'plain text pretending to be a DOC')
+
+        compiler = DocumentCompiler(self.temp_dir, self.output_file)
+        stdout = io.StringIO()
+        with patch.object(compiler, '_run_soffice_convert') as mock_soffice, \
+             contextlib.redirect_stdout(stdout):
+            content, method = compiler.convert_doc_to_text(doc_file)
+
+        mock_soffice.assert_not_called()
+        self.assertIn('Failed to convert DOC', content)
+        self.assertEqual(method, 'failed')
+        # LibreOffice was never involved, so it is not blamed
+        self.assertIn('does not look like a Word document', stdout.getvalue())
+        self.assertNotIn('LibreOffice', stdout.getvalue())
+
+    def test_doc_signature_accepts_known_formats(self):
+        """OLE2, DOCX, RTF and HTML files with a .doc extension are passed on."""
+        from documix.documix import _doc_input_problem
+        doc_file = os.path.join(self.temp_dir, 'test.doc')
+        for head in (OLE2_HEADER, b'PK\x03\x04', b'{\\rtf1\\ansi', b'\xef\xbb\xbf  <html>'):
+            with open(doc_file, 'wb') as f:
+                f.write(head + b'body')
+            self.assertIsNone(_doc_input_problem(doc_file), head)
+
     def test_doc_conversion_soffice_stderr(self):
         """Test handling of LibreOffice stderr output."""
         from unittest.mock import patch, MagicMock
@@ -176,16 +179,16 @@ class TestDOCConversionEdgeCases(unittest.TestCase):
         # Create a minimal DOC file
         doc_file = os.path.join(self.temp_dir, 'test.doc')
         with open(doc_file, 'wb') as f:
-            f.write(b'DOC file content')
+            f.write(OLE2_HEADER + b'DOC file content')
 
         compiler = DocumentCompiler(self.temp_dir, self.output_file)
 
-        # Mock subprocess.run to raise CalledProcessError with stderr
+        # Mock the LibreOffice call to raise CalledProcessError with stderr
         error = subprocess.CalledProcessError(1, 'soffice')
         error.stderr = 'LibreOffice error: conversion failed'
         error.stdout = ''
 
-        with patch('subprocess.run', side_effect=error):
+        with patch.object(compiler, '_run_soffice_convert', side_effect=error):
             content, method = compiler.convert_doc_to_text(doc_file)
 
         # Should handle the error gracefully
@@ -199,42 +202,258 @@ class TestDOCConversionEdgeCases(unittest.TestCase):
         # Create a minimal DOC file
         doc_file = os.path.join(self.temp_dir, 'test.doc')
         with open(doc_file, 'wb') as f:
-            f.write(b'DOC file content')
+            f.write(OLE2_HEADER + b'DOC file content')
 
         compiler = DocumentCompiler(self.temp_dir, self.output_file)
 
-        # Mock subprocess.run to succeed but don't create output file
+        # Mock the LibreOffice call to succeed but don't create output file
         mock_result = MagicMock()
         mock_result.returncode = 0
         mock_result.stdout = 'Conversion completed'
         mock_result.stderr = ''
 
-        with patch('subprocess.run', return_value=mock_result):
+        with patch.object(compiler, '_run_soffice_convert', return_value=mock_result):
             content, method = compiler.convert_doc_to_text(doc_file)
 
         # Should fail because output file doesn't exist
         self.assertIn('Failed to convert DOC', content)
         self.assertEqual(method, 'failed')
 
+    def test_soffice_convert_uses_listener_with_unoconv(self):
+        """With unoconv installed, conversions go through the shared listener."""
+        compiler = DocumentCompiler(self.temp_dir, self.output_file)
+        connection = 'socket,host=127.0.0.1,port=2002;urp;StarOffice.ComponentContext'
+
+        with patch.object(compiler, 'is_unoconv_available', return_value=True), \
+             patch('documix.documix._SOFFICE_DAEMON.connection', return_value=connection), \
+             patch('subprocess.run') as mock_run:
+            compiler._run_soffice_convert(['in.doc'], self.temp_dir)
+
+        args = mock_run.call_args[0][0]
+        self.assertEqual(os.path.basename(args[0]), 'unoconv')
+        self.assertEqual(args[1:3], ['--connection', connection])
+        self.assertEqual(args[-3:], ['-o', self.temp_dir, 'in.doc'])
+
+    def test_listener_conversions_run_one_at_a_time(self):
+        """The shared listener never receives two conversions at once."""
+        compiler = DocumentCompiler(self.temp_dir, self.output_file, jobs=4)
+        connection = 'socket,host=127.0.0.1,port=2002;urp;StarOffice.ComponentContext'
+        running = []
+        overlaps = []
+
+        def fake_run(args, **kwargs):
+            running.append(args)
+            overlaps.append(len(running))
+            time.sleep(0.05)
+            running.remove(args)
+
+        with patch.object(compiler, 'is_unoconv_available', return_value=True), \
+             patch('documix.documix._SOFFICE_DAEMON.connection', return_value=connection), \
+             patch('subprocess.run', side_effect=fake_run), \
+             ThreadPoolExecutor(max_workers=4) as pool:
+            for name in ('a.doc', 'b.doc', 'c.doc'):
+                pool.submit(compiler._run_soffice_convert, [name], self.temp_dir)
+
+        self.assertEqual(len(overlaps), 3)
+        self.assertEqual(max(overlaps), 1)
+
+    def test_unoconv_failure_falls_back_to_one_shot(self):
+        """A failing unoconv disables the listener and retries with soffice."""
+        compiler = DocumentCompiler(self.temp_dir, self.output_file, jobs=1)
+        daemon = _SofficeDaemon()
+        connection = 'socket,host=127.0.0.1,port=2002;urp;StarOffice.ComponentContext'
+        failure = subprocess.CalledProcessError(1, 'unoconv', stderr='pyuno mismatch')
+
+        with patch.object(compiler, 'is_unoconv_available', return_value=True), \
+             patch('documix.documix._SOFFICE_DAEMON', daemon), \
+             patch.object(daemon, '_start'), \
+             patch('subprocess.run', side_effect=[failure, MagicMock()]) as mock_run:
+            daemon.process, daemon.port = MagicMock(), 2002
+            daemon.process.poll.return_value = None
+            compiler._run_soffice_convert(['in.doc'], self.temp_dir)
+
+            self.assertIsNone(daemon.connection())
+
+        unoconv_args, soffice_args = (c[0][0] for c in mock_run.call_args_list)
+        self.assertEqual(os.path.basename(unoconv_args[0]), 'unoconv')
+        self.assertIn(connection, unoconv_args)
+        self.assertEqual(os.path.basename(soffice_args[0]), 'soffice')
+        self.assertEqual(soffice_args[1:], ['--convert-to', 'docx', '--outdir', self.temp_dir, 'in.doc'])
+        self.assertTrue(daemon.failed)
+
+    def test_listener_failed_start_is_not_retried(self):
+        """After the listener fails to start, later calls skip straight to one-shot."""
+        # Resolve soffice afresh under plain unittest too, where the conftest
+        # autouse fixture does not run
+        _tool_path.cache_clear()
+        self.addCleanup(_tool_path.cache_clear)
+        daemon = _SofficeDaemon()
+        with patch('shutil.which', return_value='/opt/bin/soffice'), \
+             patch('subprocess.Popen', side_effect=OSError('boom')) as mock_popen:
+            self.assertIsNone(daemon.connection())
+            self.assertIsNone(daemon.connection())
+
+        mock_popen.assert_called_once()
+        self.assertEqual(mock_popen.call_args[0][0][0], '/opt/bin/soffice')
+
+    def test_soffice_convert_falls_back_to_one_shot(self):
+        """Without unoconv (or a listener), soffice is spawned per file."""
+        compiler = DocumentCompiler(self.temp_dir, self.output_file, jobs=1)
+
+        for unoconv, connection in ((False, 'unused'), (True, None)):
+            with patch.object(compiler, 'is_unoconv_available', return_value=unoconv), \
+                 patch('documix.documix._SOFFICE_DAEMON.connection', return_value=connection), \
+                 patch('subprocess.run') as mock_run:
+                compiler._run_soffice_convert(['in.doc'], self.temp_dir)
+
+            args = mock_run.call_args[0][0]
+            self.assertEqual(os.path.basename(args[0]), 'soffice')
+            self.assertEqual(args[1:], ['--convert-to', 'docx', '--outdir', self.temp_dir, 'in.doc'])
+
+    def test_parallel_one_shot_soffice_reuses_private_profile(self):
+        """Parallel one-shot soffice gets a private profile that later calls reuse."""
+        compiler = DocumentCompiler(self.temp_dir, self.output_file, jobs=4)
+
+        with patch.object(compiler, 'is_unoconv_available', return_value=False), \
+             patch('subprocess.run') as mock_run:
+            compiler._run_soffice_convert(['a.doc'], self.temp_dir)
+            compiler._run_soffice_convert(['b.doc'], self.temp_dir)
+
+        first, second = (c[0][0] for c in mock_run.call_args_list)
+        self.assertEqual(os.path.basename(first[0]), 'soffice')
+        self.assertTrue(first[1].startswith('-env:UserInstallation=file://'))
+        self.assertEqual(first[1], second[1])
+        # The profile outlives the call but is removed with the temp dirs
+        profile_dir = compiler._soffice_profiles[0]
+        self.assertEqual(first[1], f'-env:UserInstallation={Path(profile_dir).as_uri()}')
+        self.assertIn(profile_dir, compiler.temp_dirs)
+
+    def test_run_tool_resolves_binary_once(self):
+        """External tools are spawned by absolute path without closing fds."""
+        # Start from an empty cache under plain unittest too, where the
+        # conftest autouse fixture does not run
+        _tool_path.cache_clear()
+        self.addCleanup(_tool_path.cache_clear)
+        with patch('shutil.which', return_value='/opt/bin/soffice') as mock_which, \
+             patch('subprocess.run') as mock_run:
+            _run_tool(['soffice', '--version'], check=True)
+            _run_tool(['soffice', '--version'], check=True)
+
+        mock_which.assert_called_once_with('soffice')
+        mock_run.assert_called_with(['/opt/bin/soffice', '--version'], close_fds=False, check=True)
+
+    def test_batch_conversion_single_soffice_call(self):
+        """Several DOC files are converted by one LibreOffice invocation."""
+        paths = []
+        for sub in ('a', 'b'):
+            os.makedirs(os.path.join(self.temp_dir, sub))
+            path = os.path.join(self.temp_dir, sub, 'same.doc')
+            with open(path, 'wb') as f:
+                f.write(OLE2_HEADER + sub.encode() * 10)
+            paths.append(path)
+        empty_doc = os.path.join(self.temp_dir, 'empty.doc')
+        open(empty_doc, 'wb').close()
+        paths.append(empty_doc)
 
-class TestPaddleOCRConversion(unittest.TestCase):
-    """Tests for PaddleOCR PDF conversion."""
+        compiler = DocumentCompiler(self.temp_dir, self.output_file)
+
+        def mock_run(doc_paths, outdir):
+            for doc_path in doc_paths:
+                with open(doc_path, 'rb') as src, \
+                     open(os.path.splitext(doc_path)[0] + '.docx', 'wb') as dst:
+                    dst.write(src.read())
+            return MagicMock(returncode=0, stdout='', stderr='')
+
+        def mock_docx(path):
+            with open(path, 'rb') as f:
+                return f.read()[len(OLE2_HEADER):].decode(), "pandoc"
+
+        with patch.object(compiler, '_run_soffice_convert', side_effect=mock_run) as mock_soffice, \
+             patch.object(compiler, 'convert_docx_to_text', side_effect=mock_docx):
+            results = compiler.convert_docs_to_text_batch(paths)
+
+        self.assertEqual(mock_soffice.call_count, 1)
+        self.assertEqual(len(mock_soffice.call_args[0][0]), 2)
+        self.assertEqual(results[paths[0]], ("a" * 10, "soffice+pandoc"))
+        self.assertEqual(results[paths[1]], ("b" * 10, "soffice+pandoc"))
+        self.assertEqual(results[empty_doc][1], "failed")
+
+    def test_batch_conversion_falls_back_per_file(self):
+        """Files missing from the batch output are converted individually."""
+        paths = []
+        for name in ('one.doc', 'two.doc'):
+            path = os.path.join(self.temp_dir, name)
+            with open(path, 'wb') as f:
+                f.write(OLE2_HEADER + b'DOC file content')
+            paths.append(path)
+
+        compiler = DocumentCompiler(self.temp_dir, self.output_file)
+        error = subprocess.CalledProcessError(1, 'soffice')
+
+        with patch.object(compiler, '_run_soffice_convert', side_effect=error), \
+             patch.object(compiler, 'convert_doc_to_text',
+                          return_value=("single", "soffice+pandoc")) as mock_single:
+            results = compiler.convert_docs_to_text_batch(paths)
+
+        self.assertEqual(mock_single.call_count, 2)
+        self.assertEqual(results[paths[1]], ("single", "soffice+pandoc"))
+
+    def test_compile_batches_doc_files(self):
+        """compile() hands all DOC files to one batch and keeps file order."""
+        for name in ('a.doc', 'b.txt', 'c.doc'):
+            with open(os.path.join(self.temp_dir, name), 'wb') as f:
+                f.write(b'content')
+        compiler = DocumentCompiler(self.temp_dir, self.output_file, jobs=1)
+        files = compiler.collect_files()
+        docs = [files[0], files[2]]
+
+        batch_result = {path: ("doc text", "soffice+pandoc") for path in docs}
+        with patch.object(compiler, 'convert_docs_to_text_batch',
+                          return_value=batch_result) as mock_batch:
+            processed = list(compiler._process_files(files))
+
+        mock_batch.assert_called_once_with(docs)
+        self.assertEqual([p for p, _, _ in processed], files)
+        self.assertEqual(processed[1][2], "direct_read")
+
+
+class ReadOnlyInputTestCase(unittest.TestCase):
+    """Base for converter tests that only read a single dummy input file.
+
+    Subclasses set input_name and input_bytes for the file, written once per
+    class, and input_attr, the class attribute that receives its path.
+    """
+
+    input_attr = None
+    input_name = None
+    input_bytes = None
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.output_file = os.path.join(cls.temp_dir, 'output.md')
+        path = os.path.join(cls.temp_dir, cls.input_name)
+        Path(path).write_bytes(cls.input_bytes)
+        setattr(cls, cls.input_attr, path)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
 
     def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.output_file = os.path.join(self.temp_dir, 'output.md')
         self.compiler = DocumentCompiler(
             source_path=self.temp_dir,
             output_file=self.output_file,
             recursive=False
         )
-        # Create a dummy PDF file
-        self.pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(self.pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 dummy')
 
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+
+class TestPaddleOCRConversion(ReadOnlyInputTestCase):
+    """Tests for PaddleOCR PDF conversion."""
+
+    input_attr = 'pdf_file'
+    input_name = 'test.pdf'
+    input_bytes = b'%PDF-1.4 dummy'
 
     def test_paddleocr_unavailable_returns_none(self):
         """Test that converter returns (None, None) when PaddleOCR is not installed."""
@@ -343,24 +562,38 @@ class TestPaddleOCRConversion(unittest.TestCase):
                 self.assertIsNone(text)
                 self.assertIsNone(method)
 
-
-class TestPDFTableConversion(unittest.TestCase):
+    def test_ml_converters_run_one_at_a_time(self):
+        """Parallel jobs never run two model-loading conversions at once."""
+        compiler = DocumentCompiler(self.temp_dir, self.output_file, jobs=4)
+        compiler._paddleocr_python = '/usr/bin/python3'
+        running = []
+        overlaps = []
+
+        def fake_run(args, **kwargs):
+            running.append(args)
+            overlaps.append(len(running))
+            time.sleep(0.05)
+            running.remove(args)
+            return SimpleNamespace(returncode=0, stdout='text', stderr='')
+
+        with patch.object(compiler, 'is_paddleocr_available', return_value=True), \
+             patch.object(compiler, 'is_mineru_available', return_value=True), \
+             patch('subprocess.run', side_effect=fake_run), \
+             ThreadPoolExecutor(max_workers=4) as pool:
+            for _ in range(2):
+                pool.submit(compiler.convert_pdf_with_paddleocr, self.pdf_file)
+                pool.submit(compiler.convert_pdf_with_mineru, self.pdf_file)
+
+        self.assertEqual(len(overlaps), 4)
+        self.assertEqual(max(overlaps), 1)
+
+
+class TestPDFTableConversion(ReadOnlyInputTestCase):
     """Tests for PDF table conversion functionality."""
 
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.output_file = os.path.join(self.temp_dir, 'output.md')
-        self.compiler = DocumentCompiler(
-            source_path=self.temp_dir,
-            output_file=self.output_file,
-            recursive=False
-        )
-        self.pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(self.pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 dummy')
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+    input_attr = 'pdf_file'
+    input_name = 'test.pdf'
+    input_bytes = b'%PDF-1.4 dummy'
 
     def test_table_cell_density_full(self):
         """All cells filled -> 1.0."""
@@ -481,23 +714,12 @@ class TestPDFTableConversion(unittest.TestCase):
         self.assertNotIn("<div", result)
 
 
-class TestPDFConverterFallbacks(unittest.TestCase):
+class TestPDFConverterFallbacks(ReadOnlyInputTestCase):
     """Tests for PDF converter error paths."""
 
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.output_file = os.path.join(self.temp_dir, 'output.md')
-        self.compiler = DocumentCompiler(
-            source_path=self.temp_dir,
-            output_file=self.output_file,
-            recursive=False
-        )
-        self.pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(self.pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 dummy')
-
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+    input_attr = 'pdf_file'
+    input_name = 'test.pdf'
+    input_bytes = b'%PDF-1.4 dummy'
 
     def test_markitdown_uvx_not_available(self):
         """uvx not available -> (None, None)."""
@@ -528,24 +750,31 @@ class TestPDFConverterFallbacks(unittest.TestCase):
             self.assertIsNone(text)
             self.assertIsNone(method)
 
+    def test_pdftotext_reads_stdout(self):
+        """pdftotext output is taken from stdout, without a temporary file."""
+        with patch('subprocess.run', return_value=MagicMock(stdout="page text")) as mock_run:
+            text, method = self.compiler._try_pdf_pdftotext(self.pdf_file)
 
-class TestDOCXEdgeCases(unittest.TestCase):
-    """Tests for DOCX converter edge cases."""
+        self.assertEqual((text, method), ("page text", "pdftotext"))
+        self.assertEqual(mock_run.call_args[0][0][-2:], [self.pdf_file, '-'])
 
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.output_file = os.path.join(self.temp_dir, 'output.md')
-        self.compiler = DocumentCompiler(
-            source_path=self.temp_dir,
-            output_file=self.output_file,
-            recursive=False
-        )
-        self.docx_file = os.path.join(self.temp_dir, 'test.docx')
-        with open(self.docx_file, 'wb') as f:
-            f.write(b'PK fake docx')
+    def test_markitdown_reads_stdout(self):
+        """markitdown is run without -o and its stdout decoded as UTF-8."""
+        with patch('subprocess.run', return_value=MagicMock(stdout="# Title")) as mock_run:
+            text, method = self.compiler._try_pdf_markitdown(self.pdf_file)
 
-    def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+        self.assertEqual((text, method), ("# Title", "markitdown"))
+        args, kwargs = mock_run.call_args
+        self.assertNotIn('-o', args[0])
+        self.assertEqual(kwargs['env']['PYTHONIOENCODING'], 'utf-8')
+
+
+class TestDOCXEdgeCases(ReadOnlyInputTestCase):
+    """Tests for DOCX converter edge cases."""
+
+    input_attr = 'docx_file'
+    input_name = 'test.docx'
+    input_bytes = b'PK fake docx'
 
     @patch('documix.documix.DOCX2TXT_AVAILABLE', False)
     def test_docx2txt_unavailable(self):
@@ -564,5 +793,124 @@ class TestDOCXEdgeCases(unittest.TestCase):
             self.assertIsNone(method)
 
 
+class TestConversionCache(unittest.TestCase):
+    """Tests for the on-disk conversion cache."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.output_file = os.path.join(self.temp_dir, 'output.md')
+        self.compiler = DocumentCompiler(
+            source_path=self.temp_dir,
+            output_file=self.output_file,
+            converter_config={'pdf': ['pdftotext']},
+            cache_dir=self.cache_dir
+        )
+        self.pdf_file = os.path.join(self.temp_dir, 'test.pdf')
+        with open(self.pdf_file, 'wb') as f:
+            f.write(b'%PDF-1.4 dummy')
+
+    def tearDown(self):
+        discard_dir(self.temp_dir)
+
+    def test_cache_disabled_by_default(self):
+        """Without cache_dir nothing is cached."""
+        compiler = DocumentCompiler(self.temp_dir, self.output_file)
+        self.assertIsNone(compiler.cache_dir)
+        self.assertIsNone(compiler._cache_path('pdf', self.pdf_file))
+
+    def test_pdf_conversion_cached(self):
+        """Second conversion of an unchanged PDF is served from the cache."""
+        with patch.object(self.compiler, '_try_pdf_pdftotext',
+                          return_value=("PDF text", "pdftotext")) as mock_conv:
+            first = self.compiler.convert_pdf_to_text(self.pdf_file)
+            second = self.compiler.convert_pdf_to_text(self.pdf_file)
+
+        self.assertEqual(first, ("PDF text", "pdftotext"))
+        self.assertEqual(second, ("PDF text", "cache+pdftotext"))
+        mock_conv.assert_called_once_with(self.pdf_file)
+
+    def test_failed_conversion_not_cached(self):
+        """Failures are retried instead of being cached."""
+        with patch.object(self.compiler, '_try_pdf_pdftotext',
+                          return_value=(None, None)) as mock_conv:
+            self.compiler.convert_pdf_to_text(self.pdf_file)
+            text, method = self.compiler.convert_pdf_to_text(self.pdf_file)
+
+        self.assertEqual(method, "failed")
+        self.assertEqual(mock_conv.call_count, 2)
+
+    def test_cache_invalidated_on_file_change(self):
+        """Modifying the file produces a new cache key."""
+        key_before = self.compiler._cache_path('pdf', self.pdf_file)
+        with open(self.pdf_file, 'ab') as f:
+            f.write(b' more bytes')
+        key_after = self.compiler._cache_path('pdf', self.pdf_file)
+        self.assertNotEqual(key_before, key_after)
+
+    def test_cache_key_depends_on_converters(self):
+        """A different converter chain does not reuse cached output."""
+        other = DocumentCompiler(
+            self.temp_dir, self.output_file,
+            converter_config={'pdf': ['pdfplumber']},
+            cache_dir=self.cache_dir
+        )
+        self.assertNotEqual(self.compiler._cache_path('pdf', self.pdf_file),
+                            other._cache_path('pdf', self.pdf_file))
+
+    def test_zip_extraction_cached(self):
+        """A cached ZIP is returned without extracting or converting members."""
+        zip_path = os.path.join(self.temp_dir, 'archive.zip')
+        write_zip(zip_path, {'inside.txt': 'text inside the archive'})
+
+        first = self.compiler.extract_zip(zip_path)
+        with patch.object(self.compiler, 'process_file') as mock_process:
+            second = self.compiler.extract_zip(zip_path)
+
+        mock_process.assert_not_called()
+        self.assertIn('text inside the archive', second[0])
+        self.assertEqual(second, (first[0], f"cache+{first[1]}"))
+
+        # Different included extensions change which members are extracted
+        md_only = DocumentCompiler(self.temp_dir, self.output_file,
+                                   include_extensions=['.zip', '.md'], cache_dir=self.cache_dir)
+        self.assertNotEqual(self.compiler._cache_path('zip', zip_path, sorted(self.compiler._include_ext_set)),
+                            md_only._cache_path('zip', zip_path, sorted(md_only._include_ext_set)))
+
+    def test_zip_with_member_errors_not_cached(self):
+        """Archives whose members failed to process are converted again next time."""
+        zip_path = os.path.join(self.temp_dir, 'archive.zip')
+        write_zip(zip_path, {'inside.txt': 'text inside the archive'})
+
+        with patch.object(self.compiler, 'process_file', side_effect=RuntimeError("boom")):
+            self.compiler.extract_zip(zip_path)
+        _, method = self.compiler.extract_zip(zip_path)
+
+        self.assertFalse(method.startswith('cache+'))
+
+    def test_doc_conversion_cached(self):
+        """Cached DOC conversions skip the LibreOffice subprocess."""
+        doc_file = os.path.join(self.temp_dir, 'test.doc')
+        with open(doc_file, 'wb') as f:
+            f.write(OLE2_HEADER + b'DOC file content')
+
+        def mock_run(doc_paths, outdir):
+            base = os.path.splitext(os.path.basename(doc_paths[0]))[0]
+            with open(os.path.join(outdir, base + '.docx'), 'wb') as f:
+                f.write(b'PK fake docx')
+            return MagicMock(returncode=0, stdout='', stderr='')
+
+        with patch.object(self.compiler, '_run_soffice_convert',
+                          side_effect=mock_run) as mock_subprocess, \
+             patch.object(self.compiler, 'convert_docx_to_text',
+                          return_value=("DOC text", "pandoc")):
+            first = self.compiler.convert_doc_to_text(doc_file)
+            second = self.compiler.convert_doc_to_text(doc_file)
+
+        self.assertEqual(first, ("DOC text", "soffice+pandoc"))
+        self.assertEqual(second, ("DOC text", "cache+soffice+pandoc"))
+        self.assertEqual(mock_subprocess.call_count, 1)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,33 +1,61 @@
 import os
-import sys
+import re
 import subprocess
 import tempfile
 import unittest
 import zipfile
 import shutil
-import hashlib
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
-# Add parent directory to sys.path to import documix
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from tests.conftest import discard_dir, file_checksum, write_zip
+from documix.documix import (
+    DocumentCompiler, PROCESS_WINDOW_PER_WORKER, TEXT_READERS_PER_JOB, _tool_path
+)
 
-from documix.documix import DocumentCompiler
+# Sample files shared by TestDocuMix, keyed by path relative to its temp dir
+SAMPLE_FILES = {
+    'sample.py': 'def hello_world():\n    print("Hello, World!")\n',
+    'sample.md': '# Sample Markdown\n\nThis is a test file.\n',
+    'sample.txt': 'This is a sample text file for testing.\n',
+    'sample.json': '{"name": "Test", "purpose": "Testing DocuMix"}\n',
+    'nested/nested_sample.py': '# This is a nested Python file\n',
+}
+
+# Exclusion pattern compiled once and handed to compilers ready-made
+PY_FILES_PATTERN = re.compile(r'.*\.py')
+
+# Members of the sample.zip fixture
+SAMPLE_ZIP_MEMBERS = {
+    'zip_sample.txt': 'This is a text file inside a ZIP.',
+    'zip_sample.py': 'print("This is Python code inside a ZIP.")',
+    'nested/zip_nested.md': '# Nested Markdown\n\nInside a ZIP file.',
+}
 
 
 class TestDocuMix(unittest.TestCase):
     """Tests for the DocuMix package."""
 
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Create the sample files once for the whole class."""
         # Create a temporary directory for test files
-        self.temp_dir = tempfile.mkdtemp()
-        self.output_file = os.path.join(self.temp_dir, 'output.md')
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.output_file = os.path.join(cls.temp_dir, 'output.md')
         
         # Create some sample test files
-        self.create_test_files()
-        
-        # Create a DocumentCompiler instance for testing
+        cls.create_test_files()
+        cls.fixture_entries = set(os.listdir(cls.temp_dir))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the sample files."""
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        """Set up test fixtures."""
+        # Compilers keep per-run statistics, so each test gets a fresh one
         self.compiler = DocumentCompiler(
             source_path=self.temp_dir,
             output_file=self.output_file,
@@ -35,45 +63,30 @@ class TestDocuMix(unittest.TestCase):
         )
 
     def tearDown(self):
-        """Tear down test fixtures."""
-        # Clean up the temporary directory
-        shutil.rmtree(self.temp_dir)
-
-    def create_test_files(self):
+        """Remove anything a test added next to the shared sample files."""
+        for name in set(os.listdir(self.temp_dir)) - self.fixture_entries:
+            path = os.path.join(self.temp_dir, name)
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+
+    @classmethod
+    def create_test_files(cls):
         """Create sample files for testing."""
-        # Create a sample Python file
-        python_file = os.path.join(self.temp_dir, 'sample.py')
-        with open(python_file, 'w') as f:
-            f.write('def hello_world():\n    print("Hello, World!")\n')
-
-        # Create a sample Markdown file
-        md_file = os.path.join(self.temp_dir, 'sample.md')
-        with open(md_file, 'w') as f:
-            f.write('# Sample Markdown\n\nThis is a test file.\n')
-
-        # Create a sample text file
-        txt_file = os.path.join(self.temp_dir, 'sample.txt')
-        with open(txt_file, 'w') as f:
-            f.write('This is a sample text file for testing.\n')
-
-        # Create a sample JSON file
-        json_file = os.path.join(self.temp_dir, 'sample.json')
-        with open(json_file, 'w') as f:
-            f.write('{"name": "Test", "purpose": "Testing DocuMix"}\n')
-
-        # Create a nested directory with a file
-        nested_dir = os.path.join(self.temp_dir, 'nested')
-        os.makedirs(nested_dir, exist_ok=True)
-        nested_file = os.path.join(nested_dir, 'nested_sample.py')
-        with open(nested_file, 'w') as f:
-            f.write('# This is a nested Python file\n')
+        for relpath, content in SAMPLE_FILES.items():
+            path = Path(cls.temp_dir, relpath)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
 
         # Create a sample ZIP file with some content
-        zip_path = os.path.join(self.temp_dir, 'sample.zip')
-        with zipfile.ZipFile(zip_path, 'w') as zipf:
-            zipf.writestr('zip_sample.txt', 'This is a text file inside a ZIP.')
-            zipf.writestr('zip_sample.py', 'print("This is Python code inside a ZIP.")')
-            zipf.writestr('nested/zip_nested.md', '# Nested Markdown\n\nInside a ZIP file.')
+        write_zip(os.path.join(cls.temp_dir, 'sample.zip'), SAMPLE_ZIP_MEMBERS)
+
+        # Absolute fixture paths, e.g. paths.sample_py, paths.nested_sample_py
+        cls.paths = SimpleNamespace(
+            nested=os.path.join(cls.temp_dir, 'nested'),
+            **{os.path.basename(relpath).replace('.', '_'): os.path.join(cls.temp_dir, relpath)
+               for relpath in [*SAMPLE_FILES, 'sample.zip']})
 
     def test_get_file_language(self):
         """Test that file language detection works correctly."""
@@ -89,9 +102,10 @@ class TestDocuMix(unittest.TestCase):
         ]
         
         for filename, expected_language in test_cases:
-            language = self.compiler.get_file_language(filename)
-            self.assertEqual(language, expected_language, 
-                             f"Expected language '{expected_language}' for '{filename}', got '{language}'")
+            with self.subTest(filename=filename):
+                language = self.compiler.get_file_language(filename)
+                self.assertEqual(language, expected_language, 
+                                 f"Expected language '{expected_language}' for '{filename}', got '{language}'")
 
     def test_estimate_tokens(self):
         """Test token estimation functionality."""
@@ -100,29 +114,29 @@ class TestDocuMix(unittest.TestCase):
             ('Hello world', 2),  # Two words
             ('Hello, world!', 3),  # Two words + one punctuation
             ('This is a test. With two sentences.', 8),  # 6 words + 2 punctuations
+            ('   \n\t', 0),  # Whitespace only
+            ('Trailing whitespace.  \n', 3),  # Final punctuation before whitespace
         ]
         
         for text, expected_count in test_cases:
-            token_count = self.compiler.estimate_tokens(text)
-            self.assertEqual(token_count, expected_count, 
-                             f"Expected {expected_count} tokens for '{text}', got {token_count}")
+            with self.subTest(text=text):
+                token_count = self.compiler.estimate_tokens(text)
+                self.assertEqual(token_count, expected_count, 
+                                 f"Expected {expected_count} tokens for '{text}', got {token_count}")
 
     def test_collect_files(self):
         """Test that files are collected correctly, including in subdirectories if recursive=True."""
         files = self.compiler.collect_files()
         
         # Check that we have all the expected files
-        file_names = [os.path.basename(f) for f in files]
-        self.assertIn('sample.py', file_names)
-        self.assertIn('sample.md', file_names)
-        self.assertIn('sample.txt', file_names)
-        self.assertIn('sample.json', file_names)
-        self.assertIn('sample.zip', file_names)
-        
+        file_names = {os.path.basename(f) for f in files}
+        self.assertLessEqual(
+            {'sample.py', 'sample.md', 'sample.txt', 'sample.json', 'sample.zip'},
+            file_names)
+
         # Check that we have the nested file if recursive is True
-        nested_files = [f for f in files if 'nested' in f]
-        self.assertTrue(any('nested_sample.py' in f for f in nested_files), 
-                       "Nested file should be included when recursive=True")
+        self.assertIn('nested_sample.py', file_names,
+                      "Nested file should be included when recursive=True")
                        
         # Test with recursive=False
         non_recursive_compiler = DocumentCompiler(
@@ -136,6 +150,36 @@ class TestDocuMix(unittest.TestCase):
         self.assertFalse(any('nested/nested_sample.py' in f for f in files),
                         "Nested file should not be included when recursive=False")
 
+    @unittest.skipUnless(hasattr(os, 'symlink'), "symlinks not supported")
+    def test_collect_files_does_not_follow_directory_symlinks(self):
+        """Test that symlinked directories are not traversed, like os.walk."""
+        link = os.path.join(self.temp_dir, 'linked')
+        try:
+            os.symlink(self.paths.nested, link)
+        except OSError:
+            self.skipTest("cannot create symlinks here")
+
+        files = self.compiler.collect_files()
+
+        self.assertFalse(any(f.startswith(link + os.sep) for f in files))
+        self.assertEqual(sum('nested_sample.py' in f for f in files), 1)
+
+    def test_collect_files_skips_unreadable_directories(self):
+        """Test that an unreadable subdirectory is skipped instead of aborting."""
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if path == self.paths.nested:
+                raise PermissionError(13, 'Permission denied', path)
+            return real_scandir(path)
+
+        with patch('os.scandir', side_effect=scandir):
+            files = self.compiler.collect_files()
+
+        file_names = {os.path.basename(f) for f in files}
+        self.assertIn('sample.py', file_names)
+        self.assertNotIn('nested_sample.py', file_names)
+
     def test_get_directory_structure(self):
         """Test that directory structure is correctly generated."""
         structure = self.compiler.get_directory_structure()
@@ -162,15 +206,65 @@ class TestDocuMix(unittest.TestCase):
 
     def test_convert_txt_to_text(self):
         """Test text file conversion."""
-        txt_file = os.path.join(self.temp_dir, 'sample.txt')
+        txt_file = self.paths.sample_txt
         content, conversion_method = self.compiler.convert_txt_to_text(txt_file)
         
         self.assertEqual(content, 'This is a sample text file for testing.\n')
         self.assertEqual(conversion_method, 'direct_read')
 
+    def test_process_file_dispatch_table(self):
+        """Test that every handler exists and patched handlers are used."""
+        from documix.documix import FILE_HANDLERS
+        for ext, handler in FILE_HANDLERS.items():
+            self.assertTrue(callable(getattr(self.compiler, handler, None)), ext)
+
+        with patch.object(self.compiler, 'convert_epub_to_text',
+                          return_value=('epub text', 'mocked')) as mock_epub:
+            result = self.compiler.process_file(os.path.join(self.temp_dir, 'BOOK.EPUB'))
+
+        mock_epub.assert_called_once()
+        self.assertEqual(result, ('epub text', 'mocked'))
+
+    def test_process_file_skips_binary_with_unknown_extension(self):
+        """Test that files with unknown extensions are skipped when they contain NUL bytes."""
+        blob = os.path.join(self.temp_dir, 'data.bin')
+        Path(blob).write_bytes(b'\x7fELF\x02\x01\x01\x00' + bytes(range(256)))
+        notes = os.path.join(self.temp_dir, 'notes.log')
+        Path(notes).write_text('plain log line\n')
+
+        self.assertEqual(self.compiler.process_file(blob),
+                         ('[Binary file skipped: data.bin]', 'skipped'))
+        self.assertEqual(self.compiler.process_file(notes),
+                         ('plain log line\n', 'direct_read'))
+
+    def test_convert_txt_to_text_matches_text_mode_read(self):
+        """Test that small and memory-mapped reads decode like open(..., 'r')."""
+        data = 'Zażółć gęślą jaźń\r\nold mac\rline\n'.encode('utf-8') + b'bad \xff byte\n'
+        for name, repeat in (('small.txt', 1), ('large.txt', 5000)):
+            path = os.path.join(self.temp_dir, name)
+            Path(path).write_bytes(data * repeat)
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                expected = f.read()
+
+            content, method = self.compiler.convert_txt_to_text(path)
+
+            self.assertEqual(content, expected)
+            self.assertEqual(method, 'direct_read')
+
+    def test_convert_txt_to_text_falls_back_when_mmap_fails(self):
+        """Test that a large file that cannot be memory-mapped is read normally."""
+        path = os.path.join(self.temp_dir, 'unmappable.txt')
+        Path(path).write_bytes(b'line\n' * 20000)
+
+        with patch('mmap.mmap', side_effect=OSError(19, 'No such device')):
+            content, method = self.compiler.convert_txt_to_text(path)
+
+        self.assertEqual(content, 'line\n' * 20000)
+        self.assertEqual(method, 'direct_read')
+
     def test_extract_zip(self):
         """Test ZIP file extraction and processing."""
-        zip_file = os.path.join(self.temp_dir, 'sample.zip')
+        zip_file = self.paths.sample_zip
         content, conversion_method = self.compiler.extract_zip(zip_file)
         
         # Check that the content contains information about ZIP contents
@@ -190,19 +284,19 @@ class TestDocuMix(unittest.TestCase):
     def test_process_file(self):
         """Test processing different types of files."""
         # Test processing a Python file
-        py_file = os.path.join(self.temp_dir, 'sample.py')
+        py_file = self.paths.sample_py
         py_content, py_method = self.compiler.process_file(py_file)
         self.assertIn('def hello_world():', py_content)
         self.assertEqual(py_method, 'direct_read')
         
         # Test processing a Markdown file
-        md_file = os.path.join(self.temp_dir, 'sample.md')
+        md_file = self.paths.sample_md
         md_content, md_method = self.compiler.process_file(md_file)
         self.assertIn('# Sample Markdown', md_content)
         self.assertEqual(md_method, 'direct_read')
         
         # Test processing a ZIP file
-        zip_file = os.path.join(self.temp_dir, 'sample.zip')
+        zip_file = self.paths.sample_zip
         zip_content, zip_method = self.compiler.process_file(zip_file)
         self.assertIn('ZIP Archive Contents:', zip_content)
         self.assertIn('zip_extract', zip_method)
@@ -223,17 +317,80 @@ class TestDocuMix(unittest.TestCase):
             content = f.read()
             
         # Check that the file has the expected sections
-        self.assertIn('# File Summary', content)
-        self.assertIn('# Directory Information', content)
-        self.assertIn('# Directory Structure', content)
-        self.assertIn('# Files', content)
-        
+        sections = set(re.findall(r'^# (.+)$', content, re.MULTILINE))
+        self.assertLessEqual(
+            {'File Summary', 'Directory Information', 'Directory Structure', 'Files'},
+            sections)
+
         # Check that all files are included
-        self.assertIn('## File: sample.py', content)
-        self.assertIn('## File: sample.md', content)
-        self.assertIn('## File: sample.txt', content)
-        self.assertIn('## File: sample.json', content)
-        self.assertIn('## File: sample.zip', content)
+        headers = re.findall(r'^## File: (\S+)', content, re.MULTILINE)
+        self.assertLessEqual(
+            {'sample.py', 'sample.md', 'sample.txt', 'sample.json', 'sample.zip'},
+            set(headers))
+
+        # Files are written in sorted order regardless of parallel processing
+        self.assertEqual(headers, sorted(headers))
+
+    def test_compile_sequential_matches_parallel(self):
+        """Test that jobs=1 and jobs>1 produce the same file sections."""
+        outputs = []
+        for jobs in (1, 4):
+            output_file = os.path.join(self.temp_dir, f'output_{jobs}.md')
+            compiler = DocumentCompiler(self.temp_dir, output_file, jobs=jobs,
+                                        exclude_patterns=[r'output_\d+\.md'])
+            self.assertTrue(compiler.compile())
+            with open(output_file, 'r') as f:
+                content = f.read()
+            outputs.append(content[content.index('# Files'):])
+
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_text_reads_do_not_wait_for_conversions(self):
+        """Test that plain-text files are read while every conversion worker is busy."""
+        import threading
+        source_dir = os.path.join(self.temp_dir, 'readahead')
+        os.makedirs(source_dir)
+        for name in ('a.pdf', 'b.pdf', 'c.txt'):
+            Path(source_dir, name).write_text('content')
+        compiler = DocumentCompiler(source_dir, self.output_file, jobs=2)
+        text_read = threading.Event()
+        original_read = compiler.convert_txt_to_text
+
+        def blocked_pdf(path):
+            return 'pdf', 'waited' if text_read.wait(5) else 'timed_out'
+
+        def tracked_read(path):
+            result = original_read(path)
+            text_read.set()
+            return result
+
+        with patch.object(compiler, 'convert_pdf_to_text', side_effect=blocked_pdf), \
+             patch.object(compiler, 'convert_txt_to_text', side_effect=tracked_read):
+            methods = [method for _, _, method in compiler._process_files(compiler.collect_files())]
+
+        self.assertEqual(methods, ['waited', 'waited', 'direct_read'])
+
+    def test_parallel_processing_bounds_files_in_flight(self):
+        """Test that parallel processing does not start every file up front."""
+        compiler = DocumentCompiler(self.temp_dir, self.output_file, jobs=2)
+        files = [os.path.join(self.temp_dir, f'bulk_{i}.txt') for i in range(200)]
+        started = []
+
+        def fake_process(path):
+            started.append(path)
+            return 'text', 'direct_read'
+
+        with patch.object(compiler, 'process_file', side_effect=fake_process):
+            results = compiler._process_files(files)
+            first = next(results)
+            in_flight = len(started)
+            rest = list(results)
+
+        # Readers scale with jobs, and the window with all workers
+        self.assertEqual(compiler._read_workers, TEXT_READERS_PER_JOB * 2)
+        window = PROCESS_WINDOW_PER_WORKER * (compiler.jobs + compiler._read_workers)
+        self.assertLessEqual(in_flight, window + 1)
+        self.assertEqual([first[0]] + [path for path, _, _ in rest], files)
 
     def test_exclude_patterns(self):
         """Test that exclusion patterns work correctly."""
@@ -242,20 +399,35 @@ class TestDocuMix(unittest.TestCase):
             source_path=self.temp_dir,
             output_file=self.output_file,
             recursive=True,
-            exclude_patterns=[r'.*\.py']  # Exclude Python files
+            exclude_patterns=[PY_FILES_PATTERN]  # Exclude Python files
         )
-        
+        # A pre-compiled pattern is used directly, not compiled again
+        self.assertIs(compiler_with_exclusions.exclude_patterns[0], PY_FILES_PATTERN)
+
         files = compiler_with_exclusions.collect_files()
-        file_names = [os.path.basename(f) for f in files]
-        
+        file_names = {os.path.basename(f) for f in files}
+
         # Python files should be excluded
         self.assertNotIn('sample.py', file_names)
-        
+
         # Other files should be included
-        self.assertIn('sample.md', file_names)
-        self.assertIn('sample.txt', file_names)
-        self.assertIn('sample.json', file_names)
-        self.assertIn('sample.zip', file_names)
+        self.assertLessEqual({'sample.md', 'sample.txt', 'sample.json', 'sample.zip'}, file_names)
+
+    def test_exclude_patterns_match_anywhere_in_name(self):
+        """Test that patterns are searched in file names and also filter the structure."""
+        compiler = DocumentCompiler(
+            source_path=self.temp_dir,
+            output_file=self.output_file,
+            recursive=True,
+            exclude_patterns=['nested', r'\.json$']
+        )
+
+        self.assertTrue(compiler._is_excluded('nested_sample.py'))
+        self.assertFalse(compiler._is_excluded('sample.py'))
+        structure = compiler.get_directory_structure()
+        self.assertFalse(any('nested_sample.py' in entry or 'sample.json' in entry
+                             for entry in structure))
+        self.assertIn('  sample.py', structure)
 
     def test_include_extensions(self):
         """Test that extension filtering works correctly."""
@@ -268,45 +440,51 @@ class TestDocuMix(unittest.TestCase):
         )
 
         files = compiler_with_extensions.collect_files()
-        file_names = [os.path.basename(f) for f in files]
+        file_names = {os.path.basename(f) for f in files}
 
         # Only Markdown and text files should be included
-        self.assertIn('sample.md', file_names)
-        self.assertIn('sample.txt', file_names)
+        self.assertLessEqual({'sample.md', 'sample.txt'}, file_names)
 
         # Other files should be excluded
-        self.assertNotIn('sample.py', file_names)
-        self.assertNotIn('sample.json', file_names)
-        self.assertNotIn('sample.zip', file_names)
+        self.assertTrue(file_names.isdisjoint({'sample.py', 'sample.json', 'sample.zip'}))
 
     def test_rtf_extension_included(self):
         """Test that RTF files are included in default extensions."""
         self.assertIn('.rtf', self.compiler.include_extensions)
 
-    def test_convert_rtf_to_text(self):
-        """Test RTF file conversion."""
-        # Create a simple RTF file
-        rtf_content = r"""{\rtf1\ansi\deff0
+    def test_rtf_matrix(self):
+        """Test RTF conversion of well-formed, empty, malformed and Unicode input."""
+        test_cases = [
+            # (case, RTF source, text expected when a converter succeeds)
+            ('basic', r"""{\rtf1\ansi\deff0
 {\fonttbl{\f0 Arial;}}
 \f0\pard This is a test RTF document.\par
 It has multiple lines.\par
-}"""
-        rtf_file = os.path.join(self.temp_dir, 'sample.rtf')
-        with open(rtf_file, 'w') as f:
-            f.write(rtf_content)
+}""", 'test'),
+            ('empty', '', None),
+            ('minimal', r'{\rtf1}', None),
+            ('not_rtf', 'This is just plain text, not RTF format.', None),
+            ('truncated', r'{\rtf1\ansi Some text without closing brace', None),
+            ('unicode', r"""{\rtf1\ansi\deff0
+{\fonttbl{\f0 Arial;}}
+\f0\pard Hello World with special chars: caf\'e9\par
+}""", 'hello'),
+        ]
 
-        content, conversion_method = self.compiler.convert_rtf_to_text(rtf_file)
+        for case, rtf_content, expected_text in test_cases:
+            with self.subTest(case=case):
+                rtf_file = os.path.join(self.temp_dir, f'{case}.rtf')
+                Path(rtf_file).write_text(rtf_content)
 
-        # Check that conversion returned something
-        self.assertIsNotNone(content)
-        self.assertIsNotNone(conversion_method)
+                content, method = self.compiler.convert_rtf_to_text(rtf_file)
 
-        # If conversion succeeded, check content contains expected text
-        if conversion_method != 'failed':
-            self.assertIn('test', content.lower())
-        else:
-            # If all RTF tools are missing, check we get a failure message
-            self.assertIn('Failed to convert RTF', content)
+                # Never crashes: returns converted text or a failure message
+                self.assertIsNotNone(content)
+                self.assertIsNotNone(method)
+                if method == 'failed':
+                    self.assertIn('Failed to convert RTF', content)
+                elif expected_text:
+                    self.assertIn(expected_text, content.lower())
 
     def test_process_file_rtf(self):
         """Test that RTF files are processed correctly via process_file."""
@@ -316,8 +494,7 @@ It has multiple lines.\par
 \f0\pard Hello RTF World.\par
 }"""
         rtf_file = os.path.join(self.temp_dir, 'test.rtf')
-        with open(rtf_file, 'w') as f:
-            f.write(rtf_content)
+        Path(rtf_file).write_text(rtf_content)
 
         content, method = self.compiler.process_file(rtf_file)
 
@@ -325,116 +502,20 @@ It has multiple lines.\par
         self.assertIsNotNone(content)
         self.assertIsNotNone(method)
 
-    def test_convert_rtf_empty_file(self):
-        """Test RTF conversion with empty/minimal RTF content."""
-        # Test with completely empty file
-        empty_rtf = os.path.join(self.temp_dir, 'empty.rtf')
-        with open(empty_rtf, 'w') as f:
-            f.write('')
-
-        content, method = self.compiler.convert_rtf_to_text(empty_rtf)
-        self.assertIsNotNone(content)
-        self.assertIsNotNone(method)
-
-        # Test with minimal valid RTF
-        minimal_rtf = os.path.join(self.temp_dir, 'minimal.rtf')
-        with open(minimal_rtf, 'w') as f:
-            f.write(r'{\rtf1}')
-
-        content, method = self.compiler.convert_rtf_to_text(minimal_rtf)
-        self.assertIsNotNone(content)
-        self.assertIsNotNone(method)
-
-    def test_convert_rtf_invalid_file(self):
-        """Test RTF conversion with malformed RTF content."""
-        # Test with random text (not RTF)
-        not_rtf = os.path.join(self.temp_dir, 'not_rtf.rtf')
-        with open(not_rtf, 'w') as f:
-            f.write('This is just plain text, not RTF format.')
-
-        content, method = self.compiler.convert_rtf_to_text(not_rtf)
-        # Should not crash, returns something
-        self.assertIsNotNone(content)
-        self.assertIsNotNone(method)
-
-        # Test with truncated RTF (missing closing braces)
-        truncated_rtf = os.path.join(self.temp_dir, 'truncated.rtf')
-        with open(truncated_rtf, 'w') as f:
-            f.write(r'{\rtf1\ansi Some text without closing brace')
-
-        content, method = self.compiler.convert_rtf_to_text(truncated_rtf)
-        self.assertIsNotNone(content)
-        self.assertIsNotNone(method)
-
-    def test_convert_rtf_unicode(self):
-        """Test RTF conversion preserves Unicode characters."""
-        # RTF with Unicode escape sequences for special characters
-        unicode_rtf = os.path.join(self.temp_dir, 'unicode.rtf')
-        rtf_content = r"""{\rtf1\ansi\deff0
-{\fonttbl{\f0 Arial;}}
-\f0\pard Hello World with special chars: caf\'e9\par
-}"""
-        with open(unicode_rtf, 'w') as f:
-            f.write(rtf_content)
-
-        content, method = self.compiler.convert_rtf_to_text(unicode_rtf)
-        self.assertIsNotNone(content)
-        # If conversion succeeded, check for presence of text
-        if method != 'failed':
-            self.assertIn('Hello', content)
-
-    def test_rtf_fallback_to_striprtf(self):
-        """Test RTF falls back to striprtf when pandoc and unrtf fail."""
-        rtf_file = os.path.join(self.temp_dir, 'fallback.rtf')
-        with open(rtf_file, 'w') as f:
-            f.write(r'{\rtf1\ansi\deff0 Test content for fallback.\par}')
-
-        # Mock subprocess.run to make pandoc and unrtf fail
-        def mock_subprocess_run(args, **kwargs):
-            if args[0] in ['pandoc', 'unrtf']:
-                raise FileNotFoundError(f"Mock failure of {args[0]}")
-            raise FileNotFoundError("Unknown command")
-
-        with patch('subprocess.run', side_effect=mock_subprocess_run):
-            content, method = self.compiler.convert_rtf_to_text(rtf_file)
-            # Should either use striprtf or fail gracefully
-            self.assertIsNotNone(content)
-            self.assertIn(method, ['striprtf', 'failed'])
-
-    def test_rtf_all_methods_fail(self):
-        """Test RTF returns error when all conversion methods fail."""
-        rtf_file = os.path.join(self.temp_dir, 'allfail.rtf')
-        with open(rtf_file, 'w') as f:
-            f.write(r'{\rtf1\ansi\deff0 Test content.\par}')
-
-        # Mock all methods to fail
-        def mock_subprocess_run(args, **kwargs):
-            raise FileNotFoundError(f"Mock failure of {args[0]}")
-
-        with patch('subprocess.run', side_effect=mock_subprocess_run):
-            # Also mock striprtf import to fail
-            with patch.dict('sys.modules', {'striprtf': None, 'striprtf.striprtf': None}):
-                content, method = self.compiler.convert_rtf_to_text(rtf_file)
-                self.assertEqual(method, 'failed')
-                self.assertIn('Failed to convert RTF', content)
-
     def test_rtf_conversion_preserves_original(self):
         """Test that RTF conversion doesn't modify the source file."""
         rtf_file = os.path.join(self.temp_dir, 'preserve.rtf')
         rtf_content = r'{\rtf1\ansi\deff0 Original content.\par}'
-        with open(rtf_file, 'w') as f:
-            f.write(rtf_content)
+        Path(rtf_file).write_text(rtf_content)
 
         # Get checksum before conversion
-        with open(rtf_file, 'rb') as f:
-            checksum_before = hashlib.md5(f.read()).hexdigest()
+        checksum_before = file_checksum(rtf_file)
 
         # Convert the file
         self.compiler.convert_rtf_to_text(rtf_file)
 
         # Get checksum after conversion
-        with open(rtf_file, 'rb') as f:
-            checksum_after = hashlib.md5(f.read()).hexdigest()
+        checksum_after = file_checksum(rtf_file)
 
         # File should be unchanged
         self.assertEqual(checksum_before, checksum_after,
@@ -446,8 +527,7 @@ It has multiple lines.\par
         zip_path = os.path.join(self.temp_dir, 'with_rtf.zip')
         rtf_content = r'{\rtf1\ansi\deff0 RTF inside ZIP.\par}'
 
-        with zipfile.ZipFile(zip_path, 'w') as zipf:
-            zipf.writestr('document.rtf', rtf_content)
+        write_zip(zip_path, {'document.rtf': rtf_content})
 
         # Process the ZIP
         content, method = self.compiler.extract_zip(zip_path)
@@ -460,8 +540,7 @@ It has multiple lines.\par
         """Test .RTF extension is handled (case insensitive)."""
         # Create file with uppercase extension
         rtf_upper = os.path.join(self.temp_dir, 'UPPERCASE.RTF')
-        with open(rtf_upper, 'w') as f:
-            f.write(r'{\rtf1\ansi\deff0 Uppercase extension test.\par}')
+        Path(rtf_upper).write_text(r'{\rtf1\ansi\deff0 Uppercase extension test.\par}')
 
         # process_file uses lowercase comparison
         content, method = self.compiler.process_file(rtf_upper)
@@ -478,11 +557,8 @@ It has multiple lines.\par
         paragraph = r'This is a paragraph of text that will be repeated many times to create a large RTF file for testing purposes.\par '
         repeat_count = 5000
 
-        with open(large_rtf, 'w') as f:
-            f.write(rtf_header)
-            for _ in range(repeat_count):
-                f.write(paragraph)
-            f.write(rtf_footer)
+        Path(large_rtf).write_bytes(
+            (rtf_header + paragraph * repeat_count + rtf_footer).encode('ascii'))
 
         # Verify file is reasonably large
         file_size = os.path.getsize(large_rtf)
@@ -501,8 +577,7 @@ It has multiple lines.\par
         """Test full compile includes RTF files correctly."""
         # Create an RTF file in the temp directory
         rtf_file = os.path.join(self.temp_dir, 'compile_test.rtf')
-        with open(rtf_file, 'w') as f:
-            f.write(r'{\rtf1\ansi\deff0 Content for compile test.\par}')
+        Path(rtf_file).write_text(r'{\rtf1\ansi\deff0 Content for compile test.\par}')
 
         # Run compile
         result = self.compiler.compile()
@@ -522,19 +597,38 @@ It has multiple lines.\par
         """Test ZIP extraction with invalid/corrupt ZIP file."""
         # Create a file that's not a valid ZIP
         bad_zip = os.path.join(self.temp_dir, 'bad.zip')
-        with open(bad_zip, 'w') as f:
-            f.write('This is not a ZIP file')
+        Path(bad_zip).write_text('This is not a ZIP file')
 
         content, method = self.compiler.extract_zip(bad_zip)
         self.assertEqual(method, 'failed-bad_zip')
         self.assertIn('not a valid ZIP file', content)
 
+    def test_extract_zip_extracts_only_included_members(self):
+        """Test that skipped and oversized ZIP members are listed but not extracted."""
+        zip_path = os.path.join(self.temp_dir, 'mixed.zip')
+        write_zip(zip_path, {
+            'keep.txt': 'small text',
+            'big.txt': 'x' * 2048,
+            'image.bin': b'\x00' * 16,
+        })
+
+        with patch('documix.documix.MAX_ZIP_MEMBER_SIZE', 1024), \
+             patch('zipfile.ZipFile.extract', autospec=True,
+                   side_effect=zipfile.ZipFile.extract) as mock_extract:
+            content, method = self.compiler.extract_zip(zip_path)
+
+        extracted = [call.args[1].filename for call in mock_extract.call_args_list]
+        self.assertEqual(extracted, ['keep.txt'])
+        self.assertIn('- image.bin', content)
+        self.assertIn('small text', content)
+        self.assertIn('### File: big.txt\n\n[Skipped: file is larger than', content)
+        self.assertTrue(method.startswith('zip_extract'))
+
     def test_extract_zip_exception(self):
         """Test ZIP extraction handles general exceptions."""
         # Create a ZIP file then make it unreadable by using a mock
         zip_path = os.path.join(self.temp_dir, 'error.zip')
-        with zipfile.ZipFile(zip_path, 'w') as zipf:
-            zipf.writestr('test.txt', 'content')
+        write_zip(zip_path, {'test.txt': 'content'})
 
         # Mock ZipFile to raise an exception
         with patch('zipfile.ZipFile') as mock_zip:
@@ -547,14 +641,14 @@ It has multiple lines.\par
         """Test error handling when processing file inside ZIP fails."""
         # Create a ZIP with a file that will cause processing error
         zip_path = os.path.join(self.temp_dir, 'processing_error.zip')
-        with zipfile.ZipFile(zip_path, 'w') as zipf:
-            zipf.writestr('test.txt', 'normal content')
+        write_zip(zip_path, {'test.txt': 'normal content'})
 
         # Mock process_file to raise an exception for files inside ZIP
         original_process = self.compiler.process_file
+        raising = frozenset({'test.txt'})
 
         def mock_process(path):
-            if 'test.txt' in path and self.temp_dir not in path:
+            if os.path.basename(path) in raising:
                 raise Exception("Simulated processing error")
             return original_process(path)
 
@@ -562,96 +656,7 @@ It has multiple lines.\par
             content, method = self.compiler.extract_zip(zip_path)
             # Should still complete but with error message
             self.assertIn('zip_extract', method)
-
-    # === EPUB Conversion Tests ===
-
-    def test_convert_epub_success(self):
-        """Test EPUB conversion with mocked ebook-convert."""
-        epub_file = os.path.join(self.temp_dir, 'test.epub')
-        with open(epub_file, 'wb') as f:
-            f.write(b'fake epub content')
-
-        # Mock subprocess.run to simulate successful ebook-convert
-        def mock_run(args, **kwargs):
-            if args[0] == 'ebook-convert':
-                # Write output to the temp file
-                output_file = args[2] if len(args) > 2 else args[1]
-                with open(output_file, 'w') as f:
-                    f.write('Converted EPUB content')
-                return MagicMock(returncode=0)
-            raise FileNotFoundError()
-
-        with patch('subprocess.run', side_effect=mock_run):
-            content, method = self.compiler.convert_epub_to_text(epub_file)
-            self.assertEqual(method, 'ebook-convert')
-            self.assertIn('Converted EPUB content', content)
-
-    def test_convert_epub_failure(self):
-        """Test EPUB conversion when Calibre not installed."""
-        epub_file = os.path.join(self.temp_dir, 'test.epub')
-        with open(epub_file, 'wb') as f:
-            f.write(b'fake epub content')
-
-        # Mock subprocess.run to simulate missing ebook-convert
-        with patch('subprocess.run', side_effect=FileNotFoundError()):
-            content, method = self.compiler.convert_epub_to_text(epub_file)
-            self.assertEqual(method, 'failed')
-            self.assertIn('Failed to convert EPUB', content)
-
-    # === RTF Fallback Success Path Tests ===
-
-    def test_rtf_unrtf_success(self):
-        """Test RTF conversion succeeds with unrtf when pandoc fails."""
-        rtf_file = os.path.join(self.temp_dir, 'unrtf_test.rtf')
-        with open(rtf_file, 'w') as f:
-            f.write(r'{\rtf1\ansi Test content}')
-
-        def mock_run(args, **kwargs):
-            if args[0] == 'pandoc':
-                raise FileNotFoundError("pandoc not found")
-            if args[0] == 'unrtf':
-                result = MagicMock()
-                result.stdout = "Converted by unrtf"
-                result.returncode = 0
-                return result
-            raise FileNotFoundError()
-
-        with patch('subprocess.run', side_effect=mock_run):
-            content, method = self.compiler.convert_rtf_to_text(rtf_file)
-            self.assertEqual(method, 'unrtf')
-            self.assertIn('Converted by unrtf', content)
-
-    def test_rtf_striprtf_success(self):
-        """Test RTF conversion succeeds with striprtf when CLI tools fail."""
-        rtf_file = os.path.join(self.temp_dir, 'striprtf_test.rtf')
-        rtf_content = r'{\rtf1\ansi\deff0 Striprtf test content.\par}'
-        with open(rtf_file, 'w') as f:
-            f.write(rtf_content)
-
-        # Mock subprocess to fail for pandoc and unrtf
-        with patch('subprocess.run', side_effect=FileNotFoundError()):
-            # striprtf should be tried as fallback
-            content, method = self.compiler.convert_rtf_to_text(rtf_file)
-            # Will be 'striprtf' if installed, 'failed' otherwise
-            self.assertIn(method, ['striprtf', 'failed'])
-
-    def test_rtf_striprtf_exception(self):
-        """Test RTF conversion handles striprtf non-ImportError exceptions."""
-        rtf_file = os.path.join(self.temp_dir, 'striprtf_error.rtf')
-        with open(rtf_file, 'w') as f:
-            f.write(r'{\rtf1 Invalid content that might cause error}')
-
-        # Mock subprocess to fail
-        with patch('subprocess.run', side_effect=FileNotFoundError()):
-            # Mock striprtf to raise a different exception
-            mock_module = MagicMock()
-            mock_module.rtf_to_text = MagicMock(side_effect=ValueError("Parse error"))
-
-            with patch.dict('sys.modules', {'striprtf': mock_module, 'striprtf.striprtf': mock_module}):
-                content, method = self.compiler.convert_rtf_to_text(rtf_file)
-                # Should fail gracefully
-                self.assertEqual(method, 'failed')
-
+            self.assertIn('[Error processing file: Simulated processing error]', content)
 
     # === PDF Table Extraction Tests ===
 
@@ -708,8 +713,7 @@ It has multiple lines.\par
     def test_convert_pdf_with_tables_fallback(self):
         """Test that PDF conversion falls back when pdfplumber unavailable."""
         pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 fake pdf content')
+        Path(pdf_file).write_bytes(b'%PDF-1.4 fake pdf content')
 
         with patch('documix.documix.PDFPLUMBER_AVAILABLE', False):
             result_text, result_method = self.compiler.convert_pdf_with_tables(pdf_file)
@@ -719,8 +723,7 @@ It has multiple lines.\par
     def test_convert_pdf_to_text_pdfplumber_priority(self):
         """Test that pdfplumber is tried after PaddleOCR+MinerU fail and markitdown is NOT called."""
         pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 fake pdf content')
+        Path(pdf_file).write_bytes(b'%PDF-1.4 fake pdf content')
 
         with patch.object(
             self.compiler, 'convert_pdf_with_paddleocr',
@@ -745,8 +748,7 @@ It has multiple lines.\par
     def test_convert_pdf_to_text_pdfplumber_failure_falls_through(self):
         """Test that when pdfplumber returns None, existing tiers are tried."""
         pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 fake pdf content')
+        Path(pdf_file).write_bytes(b'%PDF-1.4 fake pdf content')
 
         with patch.object(
             self.compiler, 'convert_pdf_with_paddleocr',
@@ -769,8 +771,7 @@ It has multiple lines.\par
         """Test that PDF output uses raw markdown without code block wrapping."""
         # Create a PDF file in the temp directory
         pdf_file = os.path.join(self.temp_dir, 'table.pdf')
-        with open(pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 fake')
+        Path(pdf_file).write_bytes(b'%PDF-1.4 fake')
 
         # Mock process_file to return markdown table content
         original_process = self.compiler.process_file
@@ -792,7 +793,6 @@ It has multiple lines.\par
         # Check there's no code fence immediately before our table
         self.assertNotIn("````\n| A | B |", output)
 
-
     # === MinerU PDF Conversion Tests ===
 
     def test_html_tables_to_markdown(self):
@@ -842,8 +842,7 @@ It has multiple lines.\par
     def test_convert_pdf_with_mineru_not_installed(self):
         """Test convert_pdf_with_mineru returns (None, None) when not installed."""
         pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 fake pdf content')
+        Path(pdf_file).write_bytes(b'%PDF-1.4 fake pdf content')
 
         # Force mineru to be unavailable
         self.compiler._mineru_available = False
@@ -854,8 +853,7 @@ It has multiple lines.\par
     def test_convert_pdf_to_text_mineru_priority(self):
         """Test that MinerU is tried first and lower tiers are NOT called."""
         pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 fake pdf content')
+        Path(pdf_file).write_bytes(b'%PDF-1.4 fake pdf content')
 
         with patch.object(
             self.compiler, 'convert_pdf_with_paddleocr',
@@ -878,8 +876,7 @@ It has multiple lines.\par
     def test_convert_pdf_to_text_mineru_failure_falls_through(self):
         """Test that when MinerU fails, pdfplumber is tried next."""
         pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 fake pdf content')
+        Path(pdf_file).write_bytes(b'%PDF-1.4 fake pdf content')
 
         with patch.object(
             self.compiler, 'convert_pdf_with_paddleocr',
@@ -900,8 +897,7 @@ It has multiple lines.\par
     def test_convert_pdf_with_mineru_subprocess_failure(self):
         """Test that MinerU handles subprocess failures gracefully."""
         pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 fake pdf content')
+        Path(pdf_file).write_bytes(b'%PDF-1.4 fake pdf content')
 
         self.compiler._mineru_available = True
 
@@ -911,6 +907,158 @@ It has multiple lines.\par
             self.assertIsNone(method)
 
 
+class TestMockedConverters(unittest.TestCase):
+    """RTF and EPUB converter fallbacks with external tools faked out.
+
+    subprocess.run is patched once for the whole class; each test only
+    sets the side effect it needs.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.output_file = os.path.join(cls.temp_dir, 'output.md')
+        run_patcher = patch('subprocess.run')
+        cls.mock_run = run_patcher.start()
+        cls.addClassCleanup(run_patcher.stop)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        self.mock_run.reset_mock(return_value=True, side_effect=True)
+        # Tests patch shutil.which; resolve tools afresh under plain unittest
+        # too, where the conftest autouse fixture does not run
+        _tool_path.cache_clear()
+        self.addCleanup(_tool_path.cache_clear)
+        self.compiler = DocumentCompiler(
+            source_path=self.temp_dir,
+            output_file=self.output_file,
+            recursive=True
+        )
+
+    def test_rtf_fallback_to_striprtf(self):
+        """Test RTF falls back to striprtf when pandoc and unrtf fail."""
+        rtf_file = os.path.join(self.temp_dir, 'fallback.rtf')
+        Path(rtf_file).write_text(r'{\rtf1\ansi\deff0 Test content for fallback.\par}')
+
+        # Mock subprocess.run to make pandoc and unrtf fail
+        def mock_subprocess_run(args, **kwargs):
+            if os.path.basename(args[0]) in ['pandoc', 'unrtf']:
+                raise FileNotFoundError(f"Mock failure of {args[0]}")
+            raise FileNotFoundError("Unknown command")
+
+        self.mock_run.side_effect = mock_subprocess_run
+        content, method = self.compiler.convert_rtf_to_text(rtf_file)
+        # Should either use striprtf or fail gracefully
+        self.assertIsNotNone(content)
+        self.assertIn(method, ['striprtf', 'failed'])
+
+    def test_rtf_all_methods_fail(self):
+        """Test RTF returns error when all conversion methods fail."""
+        rtf_file = os.path.join(self.temp_dir, 'allfail.rtf')
+        Path(rtf_file).write_text(r'{\rtf1\ansi\deff0 Test content.\par}')
+
+        # Mock all methods to fail
+        def mock_subprocess_run(args, **kwargs):
+            raise FileNotFoundError(f"Mock failure of {args[0]}")
+
+        self.mock_run.side_effect = mock_subprocess_run
+        # Also mock striprtf import to fail
+        with patch.dict('sys.modules', {'striprtf': None, 'striprtf.striprtf': None}):
+            content, method = self.compiler.convert_rtf_to_text(rtf_file)
+            self.assertEqual(method, 'failed')
+            self.assertIn('Failed to convert RTF', content)
+
+    def test_convert_epub_success(self):
+        """Test EPUB conversion with mocked ebook-convert."""
+        epub_file = os.path.join(self.temp_dir, 'test.epub')
+        Path(epub_file).write_bytes(b'fake epub content')
+
+        # Mock subprocess.run to simulate successful ebook-convert
+        def mock_run(args, **kwargs):
+            if os.path.basename(args[0]) == 'ebook-convert':
+                # Write output to the temp file
+                output_file = args[2] if len(args) > 2 else args[1]
+                Path(output_file).write_text('Converted EPUB content')
+                return SimpleNamespace(returncode=0)
+            raise FileNotFoundError()
+
+        self.mock_run.side_effect = mock_run
+        content, method = self.compiler.convert_epub_to_text(epub_file)
+        self.assertEqual(method, 'ebook-convert')
+        self.assertIn('Converted EPUB content', content)
+
+    def test_convert_epub_failure(self):
+        """Test EPUB conversion when Calibre not installed."""
+        epub_file = os.path.join(self.temp_dir, 'test.epub')
+        Path(epub_file).write_bytes(b'fake epub content')
+
+        # Mock subprocess.run to simulate missing ebook-convert
+        self.mock_run.side_effect = FileNotFoundError()
+        content, method = self.compiler.convert_epub_to_text(epub_file)
+        self.assertEqual(method, 'failed')
+        self.assertIn('Failed to convert EPUB', content)
+
+    def test_rtf_unrtf_success(self):
+        """Test RTF conversion succeeds with unrtf when pandoc fails."""
+        rtf_file = os.path.join(self.temp_dir, 'unrtf_test.rtf')
+        Path(rtf_file).write_text(r'{\rtf1\ansi Test content}')
+
+        def mock_run(args, **kwargs):
+            if os.path.basename(args[0]) == 'pandoc':
+                raise FileNotFoundError("pandoc not found")
+            if os.path.basename(args[0]) == 'unrtf':
+                return SimpleNamespace(returncode=0, stdout="Converted by unrtf")
+            raise FileNotFoundError()
+
+        self.mock_run.side_effect = mock_run
+        with patch('documix.documix._have_tool', return_value=True):
+            content, method = self.compiler.convert_rtf_to_text(rtf_file)
+        self.assertEqual(method, 'unrtf')
+        self.assertIn('Converted by unrtf', content)
+
+    def test_rtf_skips_missing_tools_without_spawning(self):
+        """pandoc/unrtf absent from PATH are skipped without a subprocess."""
+        rtf_file = os.path.join(self.temp_dir, 'no_tools.rtf')
+        Path(rtf_file).write_text(r'{\rtf1\ansi Test content}')
+
+        with patch('shutil.which', return_value=None):
+            content, method = self.compiler.convert_rtf_to_text(rtf_file)
+        self.mock_run.assert_not_called()
+        self.assertIn(method, ['striprtf', 'failed'])
+
+    def test_rtf_striprtf_success(self):
+        """Test RTF conversion succeeds with striprtf when CLI tools fail."""
+        rtf_file = os.path.join(self.temp_dir, 'striprtf_test.rtf')
+        rtf_content = r'{\rtf1\ansi\deff0 Striprtf test content.\par}'
+        Path(rtf_file).write_text(rtf_content)
+
+        # Mock subprocess to fail for pandoc and unrtf
+        self.mock_run.side_effect = FileNotFoundError()
+        # striprtf should be tried as fallback
+        content, method = self.compiler.convert_rtf_to_text(rtf_file)
+        # Will be 'striprtf' if installed, 'failed' otherwise
+        self.assertIn(method, ['striprtf', 'failed'])
+
+    def test_rtf_striprtf_exception(self):
+        """Test RTF conversion handles striprtf non-ImportError exceptions."""
+        rtf_file = os.path.join(self.temp_dir, 'striprtf_error.rtf')
+        Path(rtf_file).write_text(r'{\rtf1 Invalid content that might cause error}')
+
+        # Mock subprocess to fail
+        self.mock_run.side_effect = FileNotFoundError()
+        # Mock striprtf to raise a different exception
+        mock_module = MagicMock()
+        mock_module.rtf_to_text = MagicMock(side_effect=ValueError("Parse error"))
+
+        with patch.dict('sys.modules', {'striprtf': mock_module, 'striprtf.striprtf': mock_module}):
+            content, method = self.compiler.convert_rtf_to_text(rtf_file)
+            # Should fail gracefully
+            self.assertEqual(method, 'failed')
+
+
 class TestConverterConfig(unittest.TestCase):
     """Tests for converter configuration and selection."""
 
@@ -919,7 +1067,7 @@ class TestConverterConfig(unittest.TestCase):
         self.output_file = os.path.join(self.temp_dir, 'output.md')
 
     def tearDown(self):
-        shutil.rmtree(self.temp_dir)
+        discard_dir(self.temp_dir)
 
     def _make_compiler(self, converter_config=None):
         return DocumentCompiler(
@@ -948,8 +1096,7 @@ class TestConverterConfig(unittest.TestCase):
         """When config is ['pdfplumber', 'pdftotext'], mineru is NOT called."""
         compiler = self._make_compiler({'pdf': ['pdfplumber', 'pdftotext']})
         pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 fake')
+        Path(pdf_file).write_bytes(b'%PDF-1.4 fake')
 
         with patch.object(compiler, 'convert_pdf_with_tables',
                           return_value=("table content", "pdfplumber-tables")) as mock_plumber:
@@ -963,8 +1110,7 @@ class TestConverterConfig(unittest.TestCase):
         """Config ['pdfplumber', 'mineru'] tries pdfplumber first."""
         compiler = self._make_compiler({'pdf': ['pdfplumber', 'mineru']})
         pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 fake')
+        Path(pdf_file).write_bytes(b'%PDF-1.4 fake')
 
         with patch.object(compiler, 'convert_pdf_with_tables',
                           return_value=("content", "pdfplumber-tables")) as mock_plumber:
@@ -978,8 +1124,7 @@ class TestConverterConfig(unittest.TestCase):
         """Config ['mineru'], mineru fails → returns failure message."""
         compiler = self._make_compiler({'pdf': ['mineru']})
         pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 fake')
+        Path(pdf_file).write_bytes(b'%PDF-1.4 fake')
 
         with patch.object(compiler, 'convert_pdf_with_mineru',
                           return_value=(None, None)):
@@ -991,8 +1136,7 @@ class TestConverterConfig(unittest.TestCase):
         """Config ['docx2txt'] — pandoc not called."""
         compiler = self._make_compiler({'docx': ['docx2txt']})
         docx_file = os.path.join(self.temp_dir, 'test.docx')
-        with open(docx_file, 'wb') as f:
-            f.write(b'fake docx')
+        Path(docx_file).write_bytes(b'fake docx')
 
         with patch.object(compiler, '_try_docx_pandoc') as mock_pandoc:
             with patch.object(compiler, '_try_docx_docx2txt',
@@ -1005,8 +1149,7 @@ class TestConverterConfig(unittest.TestCase):
         """Config ['striprtf'] — pandoc/unrtf not called."""
         compiler = self._make_compiler({'rtf': ['striprtf']})
         rtf_file = os.path.join(self.temp_dir, 'test.rtf')
-        with open(rtf_file, 'w') as f:
-            f.write(r'{\rtf1\ansi Test}')
+        Path(rtf_file).write_text(r'{\rtf1\ansi Test}')
 
         with patch.object(compiler, '_try_rtf_pandoc') as mock_pandoc:
             with patch.object(compiler, '_try_rtf_unrtf') as mock_unrtf:
@@ -1021,8 +1164,7 @@ class TestConverterConfig(unittest.TestCase):
         """No config = same default order as before (backward compat)."""
         compiler = self._make_compiler()
         pdf_file = os.path.join(self.temp_dir, 'test.pdf')
-        with open(pdf_file, 'wb') as f:
-            f.write(b'%PDF-1.4 fake')
+        Path(pdf_file).write_bytes(b'%PDF-1.4 fake')
 
         call_order = []
 
@@ -1051,20 +1193,17 @@ class TestCompileEdgeCases(unittest.TestCase):
         self.output_file = os.path.join(self.temp_dir, 'output.md')
 
     def tearDown(self):
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        discard_dir(self.temp_dir)
 
     def test_compile_with_suspicious_files(self):
         """Suspicious .exe file detected during compile."""
         # Create a large .exe file (>1MB)
         exe_file = os.path.join(self.temp_dir, 'malware.exe')
-        with open(exe_file, 'wb') as f:
-            f.write(b'\x00' * (1024 * 1024 + 1))  # 1MB + 1 byte
+        Path(exe_file).write_bytes(b'\x00' * (1024 * 1024 + 1))  # 1MB + 1 byte
 
         # Also create a normal text file so compile has something to process
         txt_file = os.path.join(self.temp_dir, 'readme.txt')
-        with open(txt_file, 'w') as f:
-            f.write("Hello world")
+        Path(txt_file).write_text("Hello world")
 
         compiler = DocumentCompiler(self.temp_dir, self.output_file, recursive=False)
         result = compiler.compile()
@@ -1073,8 +1212,7 @@ class TestCompileEdgeCases(unittest.TestCase):
     def test_compile_temp_dir_cleanup_error(self):
         """rmtree fails in finally block - should not raise."""
         txt_file = os.path.join(self.temp_dir, 'test.txt')
-        with open(txt_file, 'w') as f:
-            f.write("content")
+        Path(txt_file).write_text("content")
 
         compiler = DocumentCompiler(self.temp_dir, self.output_file, recursive=False)
         # Add a fake temp dir that will fail to clean up
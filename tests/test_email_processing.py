@@ -1,63 +1,108 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import copy
 import unittest
 import tempfile
 import os
+import re
 import shutil
 import io
+from pathlib import Path
 from unittest.mock import patch, MagicMock
+from tests.conftest import discard_dir
 from documix.documix import EmailProcessor, DocumentCompiler
 
+# Shared test email as raw bytes with real MIME CRLF line endings
+_EMAIL_BYTES = (
+    b"From: test@example.com\r\n"
+    b"To: recipient@example.com\r\n"
+    b"Subject: Test Email\r\n"
+    b"Date: Mon, 1 Jan 2025 12:00:00 +0000\r\n"
+    b"Message-ID: <test123@example.com>\r\n"
+    b"Content-Type: multipart/mixed; boundary=\"boundary123\"\r\n"
+    b"\r\n"
+    b"--boundary123\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"\r\n"
+    b"This is a test email body.\r\n"
+    b"\r\n"
+    b"--boundary123\r\n"
+    b"Content-Type: text/html\r\n"
+    b"\r\n"
+    b"<html><body><p>This is a <b>test</b> email body.</p></body></html>\r\n"
+    b"\r\n"
+    b"--boundary123\r\n"
+    b"Content-Type: application/pdf; name=\"test.pdf\"\r\n"
+    b"Content-Disposition: attachment; filename=\"test.pdf\"\r\n"
+    b"Content-Transfer-Encoding: base64\r\n"
+    b"\r\n"
+    b"JVBERi0xLjQKJeLjz9MKCg==\r\n"
+    b"\r\n"
+    b"--boundary123--\r\n"
+)
+
+# Headings that only the single-email report format produces
+_EMAIL_REPORT_MARKERS = (
+    b"# Email Analysis Report",
+    b"Processing mode: Single Email",
+    b"## Email Summary",
+    b"## Email Details",
+    b"### Message Information",
+)
+
+# Standard-format boilerplate that must not leak into an email report
+_STANDARD_REPORT_MARKERS = (
+    b"merged representation of all documents",
+    b"## Purpose",
+    b"packed representation",
+)
+
+# One alternation per table, so a single scan finds every marker present
+_EMAIL_REPORT_RE = re.compile(b"|".join(map(re.escape, _EMAIL_REPORT_MARKERS)))
+_STANDARD_REPORT_RE = re.compile(b"|".join(map(re.escape, _STANDARD_REPORT_MARKERS)))
+
+
 class TestEmailProcessing(unittest.TestCase):
     """Test email processing functionality."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Write and parse the shared test email once for the whole class."""
+        cls.class_dir = tempfile.mkdtemp()
+        cls.addClassCleanup(discard_dir, cls.class_dir)
+        cls.email_path = os.path.join(cls.class_dir, "test.eml")
+        Path(cls.email_path).write_bytes(_EMAIL_BYTES)
+        cls._template = EmailProcessor(cls.email_path)
+        cls._template_parsed = cls._template.parse_email()
+
     def setUp(self):
         """Set up test environment."""
         self.test_dir = tempfile.mkdtemp()
-        self.email_content = """From: test@example.com
-To: recipient@example.com
-Subject: Test Email
-Date: Mon, 1 Jan 2025 12:00:00 +0000
-Message-ID: <test123@example.com>
-Content-Type: multipart/mixed; boundary="boundary123"
-
---boundary123
-Content-Type: text/plain
-
-This is a test email body.
-
---boundary123
-Content-Type: text/html
-
-<html><body><p>This is a <b>test</b> email body.</p></body></html>
-
---boundary123
-Content-Type: application/pdf; name="test.pdf"
-Content-Disposition: attachment; filename="test.pdf"
-Content-Transfer-Encoding: base64
-
-JVBERi0xLjQKJeLjz9MKCg==
-
---boundary123--
-"""
-        
-    def tearDown(self):
-        """Clean up test environment."""
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
+        # Registered straight away so the dir goes even if setUp fails later
+        self.addCleanup(discard_dir, self.test_dir)
+
+    def link_email(self, path):
+        """Place the shared test email at path without rewriting its bytes.
+
+        Tests only read the file, so a hard link to the class copy is
+        enough; fall back to copying where links are not supported.
+        """
+        try:
+            os.link(self.email_path, path)
+        except OSError:
+            shutil.copyfile(self.email_path, path)
+
+    def parsed_email(self):
+        """Return a private copy of the already-parsed shared test email."""
+        return copy.deepcopy(self._template)
     
     def test_email_parsing(self):
         """Test basic email parsing."""
-        # Create test email file
-        email_path = os.path.join(self.test_dir, "test.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
-        
-        # Test email parsing
-        processor = EmailProcessor(email_path)
-        self.assertTrue(processor.parse_email())
-        
+        # The shared email was parsed once in setUpClass
+        self.assertTrue(self._template_parsed)
+        processor = self.parsed_email()
+
         # Check metadata extraction
         self.assertEqual(processor.metadata['from'], 'test@example.com')
         self.assertEqual(processor.metadata['to'], 'recipient@example.com')
@@ -68,16 +113,14 @@ JVBERi0xLjQKJeLjz9MKCg==
         """Test attachment folder auto-detection."""
         # Create email and attachments folder
         email_path = os.path.join(self.test_dir, "test.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
+        self.link_email(email_path)
         
         attachments_dir = os.path.join(self.test_dir, "attachments")
         os.makedirs(attachments_dir)
         
         # Create a dummy attachment
         attachment_path = os.path.join(attachments_dir, "document.txt")
-        with open(attachment_path, 'w') as f:
-            f.write("Test attachment content")
+        Path(attachment_path).write_text("Test attachment content")
         
         # Test auto-detection
         processor = EmailProcessor(email_path)
@@ -95,13 +138,8 @@ JVBERi0xLjQKJeLjz9MKCg==
     
     def test_email_body_extraction(self):
         """Test email body extraction and HTML conversion."""
-        email_path = os.path.join(self.test_dir, "test.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
-        
-        processor = EmailProcessor(email_path)
-        processor.parse_email()
-        
+        processor = self.parsed_email()
+
         body = processor.get_email_body()
         self.assertIn("test", body.lower())
         self.assertIn("**test**", body)  # HTML bold should convert to markdown
@@ -109,8 +147,7 @@ JVBERi0xLjQKJeLjz9MKCg==
     def test_compile_output(self):
         """Test email output compilation."""
         email_path = os.path.join(self.test_dir, "test.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
+        self.link_email(email_path)
         
         processor = EmailProcessor(email_path)
         processor.parse_email()
@@ -128,8 +165,7 @@ JVBERi0xLjQKJeLjz9MKCg==
         """Test integration with DocumentCompiler."""
         # Create test email
         email_path = os.path.join(self.test_dir, "test.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
+        self.link_email(email_path)
         
         # Create output file path
         output_path = os.path.join(self.test_dir, "output.md")
@@ -181,8 +217,7 @@ JVBERi0xLjQKJeLjz9MKCg==
         """Test email-specific output format."""
         # Create test email
         email_path = os.path.join(self.test_dir, "test.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
+        self.link_email(email_path)
         
         output_path = os.path.join(self.test_dir, "output.md")
         
@@ -190,27 +225,19 @@ JVBERi0xLjQKJeLjz9MKCg==
         compiler = DocumentCompiler(email_path, output_path)
         compiler.compile()
         
-        # Check output
-        with open(output_path, 'r') as f:
-            content = f.read()
-        
+        # Check output; the markers are ASCII, so search the raw bytes
+        content = Path(output_path).read_bytes()
+
         # Should have email-specific headers
-        self.assertIn("# Email Analysis Report", content)
-        self.assertIn("Processing mode: Single Email", content)
-        self.assertIn("## Email Summary", content)
-        self.assertIn("## Email Details", content)
-        self.assertIn("### Message Information", content)
-        
+        self.assertEqual(set(_EMAIL_REPORT_RE.findall(content)), set(_EMAIL_REPORT_MARKERS))
+
         # Should NOT have standard format headers
-        self.assertNotIn("merged representation of all documents", content)
-        self.assertNotIn("## Purpose", content)
-        self.assertNotIn("packed representation", content)
+        self.assertEqual(_STANDARD_REPORT_RE.findall(content), [])
     
     def test_force_format_flags(self):
         """Test forcing output format with flags."""
         email_path = os.path.join(self.test_dir, "test.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
+        self.link_email(email_path)
 
         output_path = os.path.join(self.test_dir, "output.md")
 
@@ -220,9 +247,9 @@ JVBERi0xLjQKJeLjz9MKCg==
         self.assertEqual(mode, 'standard')
 
         # Without force_format, single email should use 'single_email' mode
-        compiler2 = DocumentCompiler(email_path, output_path)
-        mode2 = compiler2.detect_processing_mode([email_path])
-        self.assertEqual(mode2, 'single_email')
+        compiler.force_format = None
+        mode = compiler.detect_processing_mode([email_path])
+        self.assertEqual(mode, 'single_email')
 
     # === Email Processing Edge Case Tests ===
 
@@ -239,8 +266,7 @@ Content-Type: text/plain
 This is a test email with DKIM signature.
 """
         email_path = os.path.join(self.test_dir, "dkim.eml")
-        with open(email_path, 'w') as f:
-            f.write(email_with_dkim)
+        Path(email_path).write_text(email_with_dkim)
 
         processor = EmailProcessor(email_path)
         self.assertTrue(processor.parse_email())
@@ -250,8 +276,7 @@ This is a test email with DKIM signature.
     def test_email_parse_failure(self):
         """Test email parsing with corrupt/unparseable file."""
         corrupt_email_path = os.path.join(self.test_dir, "corrupt.eml")
-        with open(corrupt_email_path, 'wb') as f:
-            f.write(b'\x00\x01\x02\x03\x04\x05')  # Binary garbage
+        Path(corrupt_email_path).write_bytes(b'\x00\x01\x02\x03\x04\x05')  # Binary garbage
 
         processor = EmailProcessor(corrupt_email_path)
         # Should not crash, returns False
@@ -262,11 +287,7 @@ This is a test email with DKIM signature.
 
     def test_extract_attachments_no_email_obj(self):
         """Test extract_attachments_from_email when email not parsed."""
-        email_path = os.path.join(self.test_dir, "test.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
-
-        processor = EmailProcessor(email_path)
+        processor = EmailProcessor(self.email_path)
         # Don't call parse_email, email_obj should be None
         processor.extract_attachments_from_email()
         # Should return early without error
@@ -285,8 +306,7 @@ Content-Type: text/plain
 This is a test email with BCC.
 """
         email_path = os.path.join(self.test_dir, "bcc.eml")
-        with open(email_path, 'w') as f:
-            f.write(email_with_bcc)
+        Path(email_path).write_text(email_with_bcc)
 
         processor = EmailProcessor(email_path)
         processor.parse_email()
@@ -306,8 +326,7 @@ Content-Type: text/plain
 This is a test email with CC.
 """
         email_path = os.path.join(self.test_dir, "cc.eml")
-        with open(email_path, 'w') as f:
-            f.write(email_with_cc)
+        Path(email_path).write_text(email_with_cc)
 
         output_path = os.path.join(self.test_dir, "output.md")
         compiler = DocumentCompiler(email_path, output_path)
@@ -331,8 +350,7 @@ Content-Type: text/plain
 Test email with SPF pass.
 """
         email_path = os.path.join(self.test_dir, "spf_pass.eml")
-        with open(email_path, 'w') as f:
-            f.write(email_with_auth)
+        Path(email_path).write_text(email_with_auth)
 
         output_path = os.path.join(self.test_dir, "output.md")
         compiler = DocumentCompiler(email_path, output_path)
@@ -357,8 +375,7 @@ Content-Type: text/plain
 Test email with SPF fail.
 """
         email_path = os.path.join(self.test_dir, "spf_fail.eml")
-        with open(email_path, 'w') as f:
-            f.write(email_with_auth)
+        Path(email_path).write_text(email_with_auth)
 
         output_path = os.path.join(self.test_dir, "output.md")
         compiler = DocumentCompiler(email_path, output_path)
@@ -383,8 +400,7 @@ Content-Type: text/plain
 Test email with DKIM.
 """
         email_path = os.path.join(self.test_dir, "dkim_test.eml")
-        with open(email_path, 'w') as f:
-            f.write(email_with_dkim)
+        Path(email_path).write_text(email_with_dkim)
 
         output_path = os.path.join(self.test_dir, "output.md")
         compiler = DocumentCompiler(email_path, output_path)
@@ -408,8 +424,7 @@ Content-Type: text/plain
 Test email with DMARC.
 """
         email_path = os.path.join(self.test_dir, "dmarc_test.eml")
-        with open(email_path, 'w') as f:
-            f.write(email_with_dmarc)
+        Path(email_path).write_text(email_with_dmarc)
 
         output_path = os.path.join(self.test_dir, "output.md")
         compiler = DocumentCompiler(email_path, output_path)
@@ -424,19 +439,15 @@ Test email with DMARC.
         """Test email formatting includes attachments summary with types."""
         # Create email with attachments
         email_path = os.path.join(self.test_dir, "with_att.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
+        self.link_email(email_path)
 
         # Create attachments folder with multiple file types
         att_dir = os.path.join(self.test_dir, "attachments")
         os.makedirs(att_dir)
 
-        with open(os.path.join(att_dir, "doc1.pdf"), 'wb') as f:
-            f.write(b'%PDF-1.4 fake pdf')
-        with open(os.path.join(att_dir, "doc2.pdf"), 'wb') as f:
-            f.write(b'%PDF-1.4 another fake pdf')
-        with open(os.path.join(att_dir, "report.docx"), 'wb') as f:
-            f.write(b'PK fake docx')
+        Path(att_dir, "doc1.pdf").write_bytes(b'%PDF-1.4 fake pdf')
+        Path(att_dir, "doc2.pdf").write_bytes(b'%PDF-1.4 another fake pdf')
+        Path(att_dir, "report.docx").write_bytes(b'PK fake docx')
 
         output_path = os.path.join(self.test_dir, "output.md")
         compiler = DocumentCompiler(email_path, output_path)
@@ -451,8 +462,7 @@ Test email with DMARC.
     def test_process_email_parse_failure(self):
         """process_email returns failure when parse_email returns False."""
         email_path = os.path.join(self.test_dir, "test.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
+        self.link_email(email_path)
 
         output_path = os.path.join(self.test_dir, "output.md")
         compiler = DocumentCompiler(self.test_dir, output_path)
@@ -468,8 +478,7 @@ Test email with DMARC.
     def test_process_email_exception(self):
         """process_email catches exceptions gracefully."""
         email_path = os.path.join(self.test_dir, "test.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
+        self.link_email(email_path)
 
         output_path = os.path.join(self.test_dir, "output.md")
         compiler = DocumentCompiler(self.test_dir, output_path)
@@ -483,15 +492,13 @@ Test email with DMARC.
     def test_process_email_with_text_attachment(self):
         """process_email handles text attachments in folder."""
         email_path = os.path.join(self.test_dir, "test.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
+        self.link_email(email_path)
 
         # Create attachments folder with a text file
         att_dir = os.path.join(self.test_dir, "attachments")
         os.makedirs(att_dir)
         att_file = os.path.join(att_dir, "notes.txt")
-        with open(att_file, 'w') as f:
-            f.write("Some attached notes")
+        Path(att_file).write_text("Some attached notes")
 
         output_path = os.path.join(self.test_dir, "output.md")
         compiler = DocumentCompiler(self.test_dir, output_path)
@@ -501,11 +508,7 @@ Test email with DMARC.
 
     def test_format_size_all_units(self):
         """format_size returns correct units for KB, MB, GB, TB."""
-        email_path = os.path.join(self.test_dir, "test.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
-
-        processor = EmailProcessor(email_path)
+        processor = EmailProcessor(self.email_path)
 
         self.assertIn('B', processor.format_size(500))
         self.assertIn('KB', processor.format_size(2048))
@@ -515,11 +518,7 @@ Test email with DMARC.
 
     def test_get_email_body_no_email_obj(self):
         """get_email_body returns empty string when email_obj is None."""
-        email_path = os.path.join(self.test_dir, "test.eml")
-        with open(email_path, 'w') as f:
-            f.write(self.email_content)
-
-        processor = EmailProcessor(email_path)
+        processor = EmailProcessor(self.email_path)
         # Don't call parse_email, so email_obj is None
         self.assertEqual(processor.get_email_body(), "")
 
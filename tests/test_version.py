@@ -2,13 +2,10 @@
 
 import os
 import re
-import sys
 import unittest
 from io import StringIO
 from unittest.mock import patch, MagicMock
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 import documix
 from documix.documix import (
     get_version,
@@ -21,6 +18,11 @@ from documix.documix import (
 class TestVersion(unittest.TestCase):
     """Test cases for version management."""
 
+    def setUp(self):
+        # get_version caches its git lookup; start each test from scratch
+        get_version.cache_clear()
+        self.addCleanup(get_version.cache_clear)
+
     def test_version_from_init(self):
         """__version__ matches MAJOR.DATE.PATCH pattern."""
         self.assertRegex(documix.__version__, r'^\d+\.\d+\.\d+$')
@@ -44,6 +46,13 @@ class TestVersion(unittest.TestCase):
             self.assertIn('feature-branch', version)
             self.assertIn(documix.__version__, version)
 
+    def test_get_version_runs_git_once(self):
+        """Repeated calls (one per DocumentCompiler) reuse the first git lookup."""
+        with patch('documix.documix.subprocess.run', side_effect=FileNotFoundError) as mock_run:
+            get_version()
+            get_version()
+        mock_run.assert_called_once()
+
     def test_get_version_no_git(self):
         """get_version() returns plain __version__ when git is not available."""
         with patch('documix.documix.subprocess.run', side_effect=FileNotFoundError):